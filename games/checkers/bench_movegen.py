@@ -0,0 +1,99 @@
+"""
+Move-generation benchmark for the checkers engine.
+
+Compares the English 8x8 path with international 10x10 draughts (flying
+kings, maximum-capture rule) on:
+  - perft from the start position (legal-move tree size to a fixed depth)
+  - positions sampled from random self-play games
+  - a flying-king stress position with many branching capture chains
+
+Usage:
+    python bench_movegen.py [--games N] [--depth D] [--seed S]
+"""
+
+import argparse
+import random
+import time
+
+from checkers_game import (ENGLISH, INTERNATIONAL, KING, MAN, RED, BLK, Piece,
+                           all_legal_moves, apply_move, create_board, opponent)
+
+
+def perft(board, color, depth, rules):
+    if depth == 0:
+        return 1
+    return sum(perft(apply_move(board, m), opponent(color), depth - 1, rules)
+               for m in all_legal_moves(board, color, rules))
+
+
+def sample_positions(rules, games, rng, max_plies=150):
+    """Collect (board, color) pairs from random self-play games."""
+    positions = []
+    for _ in range(games):
+        board, color = create_board(rules), RED
+        for _ in range(max_plies):
+            moves = all_legal_moves(board, color, rules)
+            if not moves:
+                break
+            positions.append((board, color))
+            board = apply_move(board, rng.choice(moves))
+            color = opponent(color)
+    return positions
+
+
+def flying_king_position():
+    """A lone king facing twelve scattered men: every capture can land on
+    several squares and the longest chain takes nine pieces, so the search
+    explores 181 complete chains before the maximum-capture filter."""
+    board = [[None] * 10 for _ in range(10)]
+    board[4][9] = Piece(0, RED, KING, 4, 9)
+    for i, (r, c) in enumerate([(3, 6), (4, 3), (5, 6), (7, 2), (8, 5), (8, 1),
+                                (4, 1), (9, 8), (5, 8), (1, 2), (1, 6), (6, 3)]):
+        board[r][c] = Piece(i, BLK, MAN, r, c)
+    return board
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def bench_positions(positions, rules, repeat=3):
+    best = float('inf')
+    moves = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        moves = 0
+        for board, color in positions:
+            moves += len(all_legal_moves(board, color, rules))
+        best = min(best, time.perf_counter() - start)
+    return moves, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Checkers move-generation benchmark')
+    parser.add_argument('--games', type=int, default=50)
+    parser.add_argument('--depth', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    print(f'{"variant":<15}{"test":<22}{"result":>12}{"seconds":>10}{"per sec":>14}')
+    for rules in (ENGLISH, INTERNATIONAL):
+        nodes, secs = timed(perft, create_board(rules), RED, args.depth, rules)
+        print(f'{rules.name:<15}{f"perft({args.depth})":<22}{nodes:>12}'
+              f'{secs:>10.3f}{nodes / secs:>14,.0f}')
+
+        positions = sample_positions(rules, args.games, random.Random(args.seed))
+        moves, secs = bench_positions(positions, rules)
+        print(f'{rules.name:<15}{f"{len(positions)} positions":<22}{moves:>12}'
+              f'{secs:>10.3f}{len(positions) / secs:>14,.0f}')
+
+    board = flying_king_position()
+    moves, secs = bench_positions([(board, RED)] * 200, INTERNATIONAL)
+    print(f'{INTERNATIONAL.name:<15}{"flying-king chains":<22}{moves // 200:>12}'
+          f'{secs:>10.3f}{200 / secs:>14,.0f}')
+
+
+if __name__ == '__main__':
+    main()
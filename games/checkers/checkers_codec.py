@@ -0,0 +1,227 @@
+"""
+Compact binary encoding of checkers match state for client sync.
+
+Snapshot layout (little-endian):
+    B  board size
+    B  flags: bit 0 = black to move, bits 1-2 = result
+       (0 none, 1 draw, 2 red wins, 3 black wins)
+    H  move_count
+    H  moves_no_cap
+    then three bitboards over the playable (dark) squares in row-major
+    order: red pieces, black pieces, kings. 8x8 uses 4 bytes each, so a
+    full snapshot is 18 bytes.
+
+Delta layout (against the previous snapshot):
+    B  flags   H  move_count   H  moves_no_cap
+    B  number of changed squares
+    then one (square index, code) byte pair per changed square, where the
+    code is 0 empty, 1 red man, 2 red king, 3 black man, 4 black king.
+
+Piece ids are not transmitted; decoded pieces are numbered per color in
+square order.
+
+Run this module to benchmark sizes and throughput against the JSON
+boards sent today:
+    python checkers_codec.py
+"""
+
+import json
+import random
+import struct
+import time
+from functools import lru_cache
+
+from checkers_game import (RED, BLK, MAN, KING, Piece, create_board,
+                           all_legal_moves, apply_move, opponent)
+
+_HEADER = struct.Struct('<BBHH')
+_DELTA_HEADER = struct.Struct('<BHHB')
+
+_RESULTS = (None, 'draw', 'red-wins', 'black-wins')
+_CODES = {(RED, MAN): 1, (RED, KING): 2, (BLK, MAN): 3, (BLK, KING): 4}
+_PIECES = {code: key for key, code in _CODES.items()}
+
+
+@lru_cache(maxsize=None)
+def playable_squares(size):
+    """Dark squares of a size x size board, in row-major order."""
+    return tuple((r, c) for r in range(size) for c in range(size) if (r + c) % 2 == 1)
+
+
+def _flags(state):
+    return (state['current_player'] == BLK) | (_RESULTS.index(state['result']) << 1)
+
+
+def _apply_flags(state, flags):
+    state['current_player'] = BLK if flags & 1 else RED
+    state['result'] = _RESULTS[(flags >> 1) & 3]
+    state['status'] = 'playing' if state['result'] is None else 'finished'
+
+
+def _code(piece):
+    return _CODES[piece.color, piece.type] if piece is not None else 0
+
+
+# ──────────────────────────────────────────────
+# Snapshots
+# ──────────────────────────────────────────────
+def encode(state):
+    """Encode board, side to move, counters and result as bytes."""
+    board = state['board']
+    size = len(board)
+    squares = playable_squares(size)
+    red = black = kings = 0
+    for i, (r, c) in enumerate(squares):
+        piece = board[r][c]
+        if piece is not None:
+            bit = 1 << i
+            if piece.color == RED:
+                red |= bit
+            else:
+                black |= bit
+            if piece.type == KING:
+                kings |= bit
+    n = (len(squares) + 7) // 8
+    return (_HEADER.pack(size, _flags(state), state['move_count'], state['moves_no_cap'])
+            + red.to_bytes(n, 'little') + black.to_bytes(n, 'little')
+            + kings.to_bytes(n, 'little'))
+
+
+def decode(data):
+    """Inverse of encode(); returns a state dict with a fresh board."""
+    size, flags, move_count, moves_no_cap = _HEADER.unpack_from(data)
+    squares = playable_squares(size)
+    n = (len(squares) + 7) // 8
+    off = _HEADER.size
+    red = int.from_bytes(data[off:off + n], 'little')
+    black = int.from_bytes(data[off + n:off + 2 * n], 'little')
+    kings = int.from_bytes(data[off + 2 * n:off + 3 * n], 'little')
+
+    board = [[None] * size for _ in range(size)]
+    ids = {RED: 0, BLK: 0}
+    occupied = red | black
+    for i, (r, c) in enumerate(squares):
+        bit = 1 << i
+        if occupied & bit:
+            color = RED if red & bit else BLK
+            board[r][c] = Piece(ids[color], color, KING if kings & bit else MAN, r, c)
+            ids[color] += 1
+
+    state = {'board': board, 'move_count': move_count, 'moves_no_cap': moves_no_cap}
+    _apply_flags(state, flags)
+    return state
+
+
+# ──────────────────────────────────────────────
+# Deltas
+# ──────────────────────────────────────────────
+def encode_delta(prev, state):
+    """Encode only the squares and counters that changed since prev."""
+    prev_board, board = prev['board'], state['board']
+    changes = bytearray()
+    count = 0
+    for i, (r, c) in enumerate(playable_squares(len(board))):
+        old, new = prev_board[r][c], board[r][c]
+        # Unchanged squares share the same Piece object after apply_move
+        if old is not new and _code(old) != _code(new):
+            changes += bytes((i, _code(new)))
+            count += 1
+    return _DELTA_HEADER.pack(_flags(state), state['move_count'],
+                              state['moves_no_cap'], count) + bytes(changes)
+
+
+def apply_delta(prev, data):
+    """Return a new state: prev with the delta applied (prev is not modified)."""
+    flags, move_count, moves_no_cap, count = _DELTA_HEADER.unpack_from(data)
+    board = [row[:] for row in prev['board']]
+    squares = playable_squares(len(board))
+    next_id = {RED: 0, BLK: 0}
+    for row in board:
+        for piece in row:
+            if piece is not None and piece.id >= next_id[piece.color]:
+                next_id[piece.color] = piece.id + 1
+
+    off = _DELTA_HEADER.size
+    for k in range(count):
+        i, code = data[off + 2 * k], data[off + 2 * k + 1]
+        r, c = squares[i]
+        if code:
+            color, kind = _PIECES[code]
+            board[r][c] = Piece(next_id[color], color, kind, r, c)
+            next_id[color] += 1
+        else:
+            board[r][c] = None
+
+    state = {'board': board, 'move_count': move_count, 'moves_no_cap': moves_no_cap}
+    _apply_flags(state, flags)
+    return state
+
+
+# ──────────────────────────────────────────────
+# Benchmark
+# ──────────────────────────────────────────────
+def to_json(state):
+    """The JSON board_state the clients exchange today."""
+    board = [[{'color': p.color, 'type': p.type} if p else None for p in row]
+             for row in state['board']]
+    return json.dumps({'board': board, 'current_player': state['current_player'],
+                       'move_count': state['move_count'],
+                       'moves_no_cap': state['moves_no_cap'],
+                       'status': state['status'], 'result': state['result']})
+
+
+def _sample_states(games=20, seed=1):
+    """Consecutive states from random self-play games."""
+    rng = random.Random(seed)
+    runs = []
+    for _ in range(games):
+        state = {'board': create_board(), 'current_player': RED, 'move_count': 0,
+                 'moves_no_cap': 0, 'status': 'playing', 'result': None}
+        run = [state]
+        while state['move_count'] < 200:
+            moves = all_legal_moves(state['board'], state['current_player'])
+            if not moves:
+                break
+            move = rng.choice(moves)
+            state = dict(state, board=apply_move(state['board'], move),
+                         current_player=opponent(state['current_player']),
+                         move_count=state['move_count'] + 1,
+                         moves_no_cap=0 if move.is_capture else state['moves_no_cap'] + 1)
+            run.append(state)
+        runs.append(run)
+    return runs
+
+
+def _rate(fn, items, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            fn(*item)
+        best = min(best, time.perf_counter() - start)
+    return len(items) / best
+
+
+def benchmark():
+    runs = _sample_states()
+    states = [s for run in runs for s in run]
+    pairs = [(a, b) for run in runs for a, b in zip(run, run[1:])]
+    snaps = [encode(s) for s in states]
+    deltas = [(a, encode_delta(a, b)) for a, b in pairs]
+
+    json_size = sum(len(to_json(s).encode()) for s in states) / len(states)
+    snap_size = sum(map(len, snaps)) / len(snaps)
+    delta_size = sum(len(d) for _, d in deltas) / len(deltas)
+    print(f'checkers: {len(states)} states from {len(runs)} games')
+    print(f'  json snapshot   {json_size:8.1f} B')
+    print(f'  binary snapshot {snap_size:8.1f} B  ({json_size / snap_size:5.1f}x smaller)')
+    print(f'  binary delta    {delta_size:8.1f} B  ({json_size / delta_size:5.1f}x smaller)')
+    print(f'  json encode     {_rate(to_json, [(s,) for s in states]):12,.0f} /s')
+    print(f'  encode          {_rate(encode, [(s,) for s in states]):12,.0f} /s')
+    print(f'  decode          {_rate(decode, [(d,) for d in snaps]):12,.0f} /s')
+    print(f'  encode_delta    {_rate(encode_delta, pairs):12,.0f} /s')
+    print(f'  apply_delta     {_rate(apply_delta, deltas):12,.0f} /s')
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -4,27 +4,35 @@ Ported from TypeScript to Python.
 
 Features:
   - Standard 8x8 checkers board
+  - International 10x10 draughts (flying kings, maximum-capture rule)
   - Red (bottom) vs Black (top), Red goes first
   - Mandatory captures enforced
-  - Multi-jump (chain capture) support
+  - Multi-jump (chain capture) support, played as one move
   - King promotion
   - 50-move draw rule
   - Mouse-driven UI with move highlighting
   - Game Over screen with restart / quit
 """
 
+import argparse
+import os
 import pygame
 import sys
-from copy import deepcopy
+from functools import lru_cache
+
+# Shared helpers (instrumentation) live one level up in games/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from instrumentation import instrument, frame_timer, tick_timer
 
 # ──────────────────────────────────────────────
 # Constants
 # ──────────────────────────────────────────────
 BOARD_SIZE   = 8
 CELL_SIZE    = 80
+BOARD_PX     = BOARD_SIZE * CELL_SIZE   # board area is fixed, cells scale
 PANEL_W      = 220
-WINDOW_W     = BOARD_SIZE * CELL_SIZE + PANEL_W
-WINDOW_H     = BOARD_SIZE * CELL_SIZE
+WINDOW_W     = BOARD_PX + PANEL_W
+WINDOW_H     = BOARD_PX
 FPS          = 60
 
 # Colors
@@ -33,6 +41,7 @@ C_LIGHT_SQ    = (238, 214, 175)
 C_DARK_SQ     = (184, 135,  98)
 C_HIGHLIGHT   = (106, 200, 100, 180)   # valid-move highlight (with alpha)
 C_SELECT      = (255, 220,  50, 200)   # selected piece ring
+C_CHOICE      = (255, 180,  50)        # pieces that tell capture chains apart
 C_RED_PIECE   = (210,  40,  40)
 C_RED_KING    = (240,  80,  40)
 C_BLACK_PIECE = (30,   30,  30)
@@ -50,6 +59,163 @@ KING = 'king'
 RED  = 'red'
 BLK  = 'black'
 
+# Diagonal directions, indexed by the ray tables below
+DIRECTIONS  = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+ALL_DIRS    = (0, 1, 2, 3)
+RED_FORWARD = (0, 1)      # red moves up the board
+BLK_FORWARD = (2, 3)      # black moves down the board
+
+
+# ──────────────────────────────────────────────
+# Compact piece / move types
+# ──────────────────────────────────────────────
+class Piece:
+    """Immutable-by-convention board piece.
+
+    `id` is a small int, unique per color. Dict-style access
+    (piece['color']) is kept for code written against the old dict pieces;
+    piece['id'] still returns the legacy 'red-3' string form.
+    """
+    __slots__ = ('id', 'color', 'type', 'row', 'col')
+
+    def __init__(self, id, color, type, row, col):
+        self.id    = id
+        self.color = color
+        self.type  = type
+        self.row   = row
+        self.col   = col
+
+    def __getitem__(self, key):
+        if key == 'id':
+            return f'{self.color}-{self.id}'
+        if key not in Piece.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def moved_to(self, row, col, promote=False):
+        """Return a copy of this piece at (row, col), optionally crowned."""
+        return Piece(self.id, self.color, KING if promote else self.type, row, col)
+
+    def __eq__(self, other):
+        return (isinstance(other, Piece)
+                and self.id == other.id and self.color == other.color
+                and self.type == other.type
+                and self.row == other.row and self.col == other.col)
+
+    def __hash__(self):
+        return hash((self.id, self.color, self.type, self.row, self.col))
+
+    def __repr__(self):
+        return (f'Piece({self.id!r}, {self.color!r}, {self.type!r}, '
+                f'{self.row}, {self.col})')
+
+
+class Move:
+    """A single move or a full capture chain.
+
+    `captured` is a tuple of (r, c) squares. Dict-style access is kept for
+    the UI: move['from'], move['to'], move['captured'], move['is_capture']
+    and move['promotes'] all work.
+    """
+    __slots__ = ('src', 'dst', 'captured', 'promotes')
+
+    _KEYS = {'from': 'src', 'to': 'dst', 'captured': 'captured',
+             'is_capture': 'is_capture', 'promotes': 'promotes'}
+
+    def __init__(self, src, dst, captured=(), promotes=False):
+        self.src      = src
+        self.dst      = dst
+        self.captured = captured
+        self.promotes = promotes
+
+    @property
+    def is_capture(self):
+        return bool(self.captured)
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, Move._KEYS[key])
+        except KeyError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __eq__(self, other):
+        return (isinstance(other, Move)
+                and self.src == other.src and self.dst == other.dst
+                and self.captured == other.captured
+                and self.promotes == other.promotes)
+
+    def __hash__(self):
+        return hash((self.src, self.dst, self.captured, self.promotes))
+
+    def __repr__(self):
+        return (f'Move({self.src}, {self.dst}, captured={self.captured}, '
+                f'promotes={self.promotes})')
+
+
+# ──────────────────────────────────────────────
+# Rule sets
+# ──────────────────────────────────────────────
+class Rules:
+    """Board size and rule options for one checkers variant."""
+
+    def __init__(self, name, title, size, piece_rows, flying_kings=False,
+                 max_capture=False, draw_moves=50):
+        self.name         = name
+        self.title        = title
+        self.size         = size
+        self.piece_rows   = piece_rows     # rows of men per side at start
+        self.flying_kings = flying_kings   # kings move / capture any distance
+        self.max_capture  = max_capture    # must take the longest chain
+        self.draw_moves   = draw_moves     # moves without capture before a draw
+
+    def __repr__(self):
+        return f'Rules({self.name!r}, size={self.size})'
+
+
+ENGLISH       = Rules('english', 'CHECKERS', 8, 3)
+INTERNATIONAL = Rules('international', 'DRAUGHTS', 10, 4,
+                      flying_kings=True, max_capture=True)
+VARIANTS      = {r.name: r for r in (ENGLISH, INTERNATIONAL)}
+
+
+@lru_cache(maxsize=None)
+def board_tables(size):
+    """Precomputed (squares, rays) lookup tables for a size x size board.
+
+    squares[r][c] is a shared (r, c) tuple, so move generation never
+    allocates coordinates. rays[r][c][d] is the tuple of squares walked from
+    (r, c) in DIRECTIONS[d], nearest first: a man's step is ray[0], its jump
+    is ray[0] over / ray[1] landing, and a flying king scans the whole ray.
+    """
+    squares = [[(r, c) for c in range(size)] for r in range(size)]
+    rays = []
+    for r in range(size):
+        row = []
+        for c in range(size):
+            dirs = []
+            for dr, dc in DIRECTIONS:
+                ray = []
+                nr, nc = r + dr, c + dc
+                while 0 <= nr < size and 0 <= nc < size:
+                    ray.append(squares[nr][nc])
+                    nr, nc = nr + dr, nc + dc
+                dirs.append(tuple(ray))
+            row.append(tuple(dirs))
+        rays.append(row)
+    return squares, rays
+
 
 # ──────────────────────────────────────────────
 # Data helpers
@@ -58,24 +224,24 @@ def opponent(color):
     return BLK if color == RED else RED
 
 
-def create_board():
-    """Return an 8x8 list-of-lists with Piece objects or None."""
-    board = [[None] * BOARD_SIZE for _ in range(BOARD_SIZE)]
+def create_board(rules=ENGLISH):
+    """Return a size x size list-of-lists with Piece objects or None."""
+    size = rules.size
+    board = [[None] * size for _ in range(size)]
     pid = [0]
 
     def place(row, col, color):
-        board[row][col] = {'id': f'{color}-{pid[0]}', 'color': color,
-                           'type': MAN, 'row': row, 'col': col}
+        board[row][col] = Piece(pid[0], color, MAN, row, col)
         pid[0] += 1
 
-    for r in range(3):
-        for c in range(BOARD_SIZE):
+    for r in range(rules.piece_rows):
+        for c in range(size):
             if (r + c) % 2 == 1:
                 place(r, c, BLK)
 
     pid[0] = 0
-    for r in range(5, BOARD_SIZE):
-        for c in range(BOARD_SIZE):
+    for r in range(size - rules.piece_rows, size):
+        for c in range(size):
             if (r + c) % 2 == 1:
                 place(r, c, RED)
 
@@ -83,134 +249,172 @@ def create_board():
 
 
 def copy_board(board):
-    return deepcopy(board)
+    # Pieces are never mutated in place, so copying the rows is enough
+    return [row[:] for row in board]
 
 
 def get_piece(board, r, c):
-    if 0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE:
+    if 0 <= r < len(board) and 0 <= c < len(board):
         return board[r][c]
     return None
 
 
 def pieces_of(board, color):
-    return [(r, c) for r in range(BOARD_SIZE)
-            for c in range(BOARD_SIZE)
-            if board[r][c] and board[r][c]['color'] == color]
+    return [(r, c) for r, row in enumerate(board)
+            for c, piece in enumerate(row)
+            if piece and piece.color == color]
 
 
 # ──────────────────────────────────────────────
 # Move logic
 # ──────────────────────────────────────────────
 def _move_dirs(piece):
-    """Movement directions (non-capture) for a piece."""
-    if piece['type'] == KING:
-        return [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-    return [(-1, -1), (-1, 1)] if piece['color'] == RED else [(1, -1), (1, 1)]
-
-
-def _jump_dirs(_piece):
-    return [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+    """Movement directions (non-capture) for a piece, as DIRECTIONS indices."""
+    if piece.type == KING:
+        return ALL_DIRS
+    return RED_FORWARD if piece.color == RED else BLK_FORWARD
 
 
-def _will_promote(piece, r):
-    if piece['type'] == KING:
+def _will_promote(piece, r, size):
+    if piece.type == KING:
         return False
-    return r == 0 if piece['color'] == RED else r == BOARD_SIZE - 1
+    return r == 0 if piece.color == RED else r == size - 1
 
 
-def normal_moves(board, r, c):
+@instrument('checkers.normal_moves')
+def normal_moves(board, r, c, rules=ENGLISH):
     piece = board[r][c]
     if not piece:
         return []
+    size = len(board)
+    squares, rays = board_tables(size)
+    flying = rules.flying_kings and piece.type == KING
+    src = squares[r][c]
     moves = []
-    for dr, dc in _move_dirs(piece):
-        nr, nc = r + dr, c + dc
-        if 0 <= nr < BOARD_SIZE and 0 <= nc < BOARD_SIZE and not board[nr][nc]:
-            moves.append({'from': (r, c), 'to': (nr, nc),
-                          'captured': [], 'is_capture': False,
-                          'promotes': _will_promote(piece, nr)})
+    for d in _move_dirs(piece):
+        for sq in rays[r][c][d]:
+            if board[sq[0]][sq[1]] is not None:
+                break
+            moves.append(Move(src, sq, (), _will_promote(piece, sq[0], size)))
+            if not flying:
+                break
     return moves
 
 
-def _explore_captures(board, r, c, piece, captured_so_far):
-    """Recursively yield all capture chains starting from (r, c)."""
+@instrument('checkers._explore_captures')
+def _explore_captures(board, rays, src, r, c, piece, flying, captured_so_far, out):
+    """Append every complete capture chain continuing from (r, c) to out.
+
+    Captured pieces stay on the board until the move is applied, so they
+    block further jumps and cannot be taken twice. Returns True if any
+    jump was possible from (r, c).
+    """
     found = False
-    results = []
-    for dr, dc in _jump_dirs(piece):
-        jr, jc = r + dr, c + dc
-        lr, lc = r + 2 * dr, c + 2 * dc
-        if not (0 <= jr < BOARD_SIZE and 0 <= jc < BOARD_SIZE):
+    size = len(board)
+    for ray in rays[r][c]:
+        n = len(ray)
+        i = 0
+        if flying:
+            while i < n and board[ray[i][0]][ray[i][1]] is None:
+                i += 1
+        if i + 1 >= n:
             continue
-        if not (0 <= lr < BOARD_SIZE and 0 <= lc < BOARD_SIZE):
+        jumped_sq = ray[i]
+        jumped = board[jumped_sq[0]][jumped_sq[1]]
+        if (jumped is None or jumped.color == piece.color
+                or jumped_sq in captured_so_far):
             continue
-        jumped = board[jr][jc]
-        landing = board[lr][lc]
-        if (jumped and jumped['color'] != piece['color']
-                and not landing
-                and (jr, jc) not in captured_so_far):
+        new_cap = captured_so_far + (jumped_sq,)
+        for j in range(i + 1, n):
+            lr, lc = land = ray[j]
+            if board[lr][lc] is not None:
+                break
             found = True
-            new_cap = captured_so_far + [(jr, jc)]
-            sub = _explore_captures(board, lr, lc, piece, new_cap)
-            if sub:
-                results.extend(sub)
-            else:
-                results.append({'from': (r, c), 'to': (lr, lc),
-                                'captured': new_cap, 'is_capture': True,
-                                'promotes': _will_promote(piece, lr)})
-    if not found and captured_so_far:
-        return None   # signal up the chain
-    return results if results else None
-
-
-def capture_moves(board, r, c):
+            if not _explore_captures(board, rays, src, lr, lc, piece,
+                                     flying, new_cap, out):
+                out.append(Move(src, land, new_cap,
+                                _will_promote(piece, lr, size)))
+            if not flying:
+                break
+    return found
+
+
+@instrument('checkers.capture_moves')
+def capture_moves(board, r, c, rules=ENGLISH):
     piece = board[r][c]
     if not piece:
         return []
-    result = _explore_captures(board, r, c, piece, [])
-    return result or []
-
-
-def legal_moves_for(board, r, c):
-    caps = capture_moves(board, r, c)
+    squares, rays = board_tables(len(board))
+    flying = rules.flying_kings and piece.type == KING
+    out = []
+    # Lift the piece off its square while exploring: a chain may pass
+    # back over (or end on) the square it started from
+    board[r][c] = None
+    try:
+        _explore_captures(board, rays, squares[r][c], r, c, piece, flying, (), out)
+    finally:
+        board[r][c] = piece
+    if rules.max_capture and out:
+        out = _longest(out)
+    return _distinct(out)
+
+
+def _longest(moves):
+    most = max(len(m.captured) for m in moves)
+    return [m for m in moves if len(m.captured) == most]
+
+
+def _distinct(moves):
+    """Drop chains that take the same pieces to the same square by another route."""
+    seen = {}
+    for m in moves:
+        seen.setdefault((m.dst, frozenset(m.captured)), m)
+    return list(seen.values())
+
+
+def legal_moves_for(board, r, c, rules=ENGLISH):
+    caps = capture_moves(board, r, c, rules)
     if caps:
         return caps
-    return normal_moves(board, r, c)
+    return normal_moves(board, r, c, rules)
 
 
-def all_legal_moves(board, color):
+@instrument('checkers.all_legal_moves')
+def all_legal_moves(board, color, rules=ENGLISH):
     caps = []
+    for r, c in pieces_of(board, color):
+        caps.extend(capture_moves(board, r, c, rules))
+    if caps:
+        return _longest(caps) if rules.max_capture else caps
     norms = []
     for r, c in pieces_of(board, color):
-        caps.extend(capture_moves(board, r, c))
-        norms.extend(normal_moves(board, r, c))
-    return caps if caps else norms
+        norms.extend(normal_moves(board, r, c, rules))
+    return norms
 
 
+@instrument('checkers.apply_move')
 def apply_move(board, move):
     nb = copy_board(board)
-    r0, c0 = move['from']
-    r1, c1 = move['to']
+    r0, c0 = move.src
+    r1, c1 = move.dst
     piece = nb[r0][c0]
     nb[r0][c0] = None
-    for jr, jc in move['captured']:
+    for jr, jc in move.captured:
         nb[jr][jc] = None
-    piece = dict(piece)
-    piece['row'], piece['col'] = r1, c1
-    if move['promotes']:
-        piece['type'] = KING
-    nb[r1][c1] = piece
+    nb[r1][c1] = piece.moved_to(r1, c1, move.promotes)
     return nb
 
 
 # ──────────────────────────────────────────────
 # Game-over check
 # ──────────────────────────────────────────────
-def check_game_over(board, current_player, moves_no_cap):
-    if moves_no_cap >= 50:
+@instrument('checkers.check_game_over')
+def check_game_over(board, current_player, moves_no_cap, rules=ENGLISH):
+    if moves_no_cap >= rules.draw_moves:
         return True, 'draw'
-    legal = all_legal_moves(board, current_player)
+    legal = all_legal_moves(board, current_player, rules)
     if not legal:
-        opp_legal = all_legal_moves(board, opponent(current_player))
+        opp_legal = all_legal_moves(board, opponent(current_player), rules)
         if not opp_legal:
             return True, 'draw'
         return True, f'{opponent(current_player)}-wins'
@@ -222,40 +426,54 @@ def check_game_over(board, current_player, moves_no_cap):
 # ──────────────────────────────────────────────
 # Rendering helpers
 # ──────────────────────────────────────────────
-def board_to_px(r, c):
-    return c * CELL_SIZE, r * CELL_SIZE
+def board_to_px(r, c, cell=CELL_SIZE):
+    return c * cell, r * cell
 
 
-def draw_board(surface):
-    for r in range(BOARD_SIZE):
-        for c in range(BOARD_SIZE):
+@instrument('checkers.draw_board')
+def draw_board(surface, size=BOARD_SIZE):
+    cell = BOARD_PX // size
+    for r in range(size):
+        for c in range(size):
             color = C_LIGHT_SQ if (r + c) % 2 == 0 else C_DARK_SQ
             pygame.draw.rect(surface, color,
-                             (c * CELL_SIZE, r * CELL_SIZE, CELL_SIZE, CELL_SIZE))
+                             (c * cell, r * cell, cell, cell))
 
 
-def draw_highlights(surface, moves, selected):
-    hl = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
+@instrument('checkers.draw_highlights')
+def draw_highlights(surface, moves, selected, cell=CELL_SIZE):
+    hl = pygame.Surface((cell, cell), pygame.SRCALPHA)
     for move in moves:
         r1, c1 = move['to']
-        x, y = board_to_px(r1, c1)
+        x, y = board_to_px(r1, c1, cell)
         hl.fill(C_HIGHLIGHT)
         surface.blit(hl, (x, y))
         pygame.draw.circle(surface, (50, 200, 50),
-                           (x + CELL_SIZE // 2, y + CELL_SIZE // 2), 10)
+                           (x + cell // 2, y + cell // 2), 10)
 
     if selected:
         sr, sc = selected
-        sx, sy = board_to_px(sr, sc)
-        sel = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
+        sx, sy = board_to_px(sr, sc, cell)
+        sel = pygame.Surface((cell, cell), pygame.SRCALPHA)
         sel.fill(C_SELECT)
         surface.blit(sel, (sx, sy))
 
 
-def draw_piece(surface, piece, r, c, wobble=0):
-    x = c * CELL_SIZE + CELL_SIZE // 2
-    y = r * CELL_SIZE + CELL_SIZE // 2 + wobble
-    radius = CELL_SIZE // 2 - 8
+@instrument('checkers.draw_choices')
+def draw_choices(surface, moves, cell=CELL_SIZE):
+    """Ring the pieces that only some of the pending capture chains take."""
+    sets = [set(m['captured']) for m in moves]
+    for r, c in set.union(*sets) - set.intersection(*sets):
+        x, y = board_to_px(r, c, cell)
+        pygame.draw.circle(surface, C_CHOICE,
+                           (x + cell // 2, y + cell // 2), cell // 2 - 4, 3)
+
+
+@instrument('checkers.draw_piece')
+def draw_piece(surface, piece, r, c, wobble=0, cell=CELL_SIZE):
+    x = c * cell + cell // 2
+    y = r * cell + cell // 2 + wobble
+    radius = cell // 2 - 8
     is_king = piece['type'] == KING
 
     # Shadow
@@ -279,8 +497,9 @@ def draw_piece(surface, piece, r, c, wobble=0):
         surface.blit(txt, (x - txt.get_width() // 2, y - txt.get_height() // 2))
 
 
+@instrument('checkers.draw_panel')
 def draw_panel(surface, state):
-    px = BOARD_SIZE * CELL_SIZE
+    px = BOARD_PX
     pygame.draw.rect(surface, C_PANEL_BG, (px, 0, PANEL_W, WINDOW_H))
 
     f_big   = pygame.font.SysFont('consolas', 22, bold=True)
@@ -293,7 +512,7 @@ def draw_panel(surface, state):
         surface.blit(surf, (x, y))
 
     # Title
-    blit('CHECKERS', f_big, C_ACCENT, 20)
+    blit(state['rules'].title, f_big, C_ACCENT, 20)
     pygame.draw.line(surface, C_ACCENT, (px + 10, 52), (px + PANEL_W - 10, 52), 1)
 
     # Turn
@@ -315,14 +534,13 @@ def draw_panel(surface, state):
     blit('Stats', f_med, C_TEXT, 240)
     blit(f'Total moves : {state["move_count"]:>3}', f_small, C_TEXT, 264, center=False)
     blit(f'No-cap moves: {state["moves_no_cap"]:>3}', f_small, C_TEXT, 284, center=False)
-    blit(f'(Draw @ 50)', f_small, (120, 120, 140), 304, center=False)
+    blit(f'(Draw @ {state["rules"].draw_moves})', f_small, (120, 120, 140), 304, center=False)
 
-    # Capture chain notice
-    if state['must_continue']:
-        pygame.draw.line(surface, (60, 60, 80),
-                         (px + 10, 330), (px + PANEL_W - 10, 330), 1)
-        blit('Must continue', f_small, (255, 180, 50), 344)
-        blit('capture chain!', f_small, (255, 180, 50), 362)
+    # Several capture chains end on the chosen square
+    if state['choices']:
+        pygame.draw.line(surface, (60, 60, 80), (px + 10, 330), (px + PANEL_W - 10, 330), 1)
+        blit('Several captures', f_small, C_CHOICE, 344)
+        blit('click a piece to take', f_small, C_CHOICE, 362)
 
     # Controls
     pygame.draw.line(surface, (60, 60, 80),
@@ -334,6 +552,7 @@ def draw_panel(surface, state):
     blit('[Q] Quit', f_small, (160, 160, 180), WINDOW_H - 26, center=False)
 
 
+@instrument('checkers.draw_game_over')
 def draw_game_over(surface, result):
     overlay = pygame.Surface((WINDOW_W, WINDOW_H), pygame.SRCALPHA)
     overlay.fill(C_OVERLAY)
@@ -368,16 +587,22 @@ def draw_game_over(surface, result):
 # Main Game class
 # ──────────────────────────────────────────────
 class CheckersGame:
-    def __init__(self):
+    def __init__(self, rules=ENGLISH):
+        self.rules = rules
+        self.cell  = BOARD_PX // rules.size
         pygame.init()
         pygame.display.set_caption('Checkers — Olos Gaming')
         self.screen = pygame.display.set_mode((WINDOW_W, WINDOW_H))
         self.clock  = pygame.time.Clock()
+        # Profiling hooks (no-ops unless OLOS_PROFILE is set)
+        self.frame_timer = frame_timer('checkers.frame')
+        self.tick_timer  = tick_timer('checkers.tick')
         self.reset()
 
     def reset(self):
         self.state = {
-            'board':          create_board(),
+            'rules':          self.rules,
+            'board':          create_board(self.rules),
             'current_player': RED,
             'status':         'playing',
             'result':         None,
@@ -385,8 +610,7 @@ class CheckersGame:
             'moves_no_cap':   0,
             'selected':       None,       # (row, col) or None
             'legal_moves':    [],
-            'must_continue':  False,
-            'chain_piece':    None,
+            'choices':        [],         # chains sharing the clicked landing square
         }
 
     # ── Input ──────────────────────────────────
@@ -396,18 +620,14 @@ class CheckersGame:
             return
 
         # Click is outside the board area
-        if mx >= BOARD_SIZE * CELL_SIZE:
+        if mx >= BOARD_PX:
             return
 
-        c, r = mx // CELL_SIZE, my // CELL_SIZE
+        c, r = mx // self.cell, my // self.cell
 
-        # If must continue capture chain, only the chain piece can be used
-        if s['must_continue']:
-            cr, cc = s['chain_piece']
-            if (r, c) == (cr, cc):
-                return   # clicked same piece, already selected — do nothing
-            # Try to move to the clicked square
-            self._try_move(r, c)
+        # Picking between capture chains that end on the same square
+        if s['choices']:
+            self._choose(r, c)
             return
 
         piece = get_piece(s['board'], r, c)
@@ -415,14 +635,11 @@ class CheckersGame:
         # Clicking own piece → select it
         if piece and piece['color'] == s['current_player']:
             s['selected'] = (r, c)
-            moves = legal_moves_for(s['board'], r, c)
-            # Enforce mandatory capture: if any capture exists globally,
-            # only show this piece's captures
-            all_moves = all_legal_moves(s['board'], s['current_player'])
-            has_global_cap = any(m['is_capture'] for m in all_moves)
-            if has_global_cap:
-                moves = [m for m in moves if m['is_capture']]
-            s['legal_moves'] = moves
+            # Mandatory (and, where the rules say so, maximum) capture is
+            # enforced globally, so only show this piece's share of the
+            # player's legal moves
+            all_moves = all_legal_moves(s['board'], s['current_player'], self.rules)
+            s['legal_moves'] = [m for m in all_moves if m['from'] == (r, c)]
             return
 
         # Clicking empty / opponent square → try moving selected piece
@@ -431,13 +648,33 @@ class CheckersGame:
 
     def _try_move(self, r, c):
         s = self.state
-        move = next((m for m in s['legal_moves'] if m['to'] == (r, c)), None)
-        if not move:
-            # Deselect if not in a chain
-            if not s['must_continue']:
-                s['selected'] = None
-                s['legal_moves'] = []
+        moves = [m for m in s['legal_moves'] if m['to'] == (r, c)]
+        if not moves:
+            s['selected'] = None
+            s['legal_moves'] = []
             return
+        if len(moves) > 1:
+            # A flying king can reach one square by chains that take
+            # different pieces; let the player say which
+            s['choices'] = moves
+            return
+        self._play(moves[0])
+
+    def _choose(self, r, c):
+        """Narrow the pending chains to those capturing (r, c)."""
+        s = self.state
+        moves = [m for m in s['choices'] if (r, c) in m['captured']]
+        if not moves:
+            # Clicked elsewhere: back to the selected piece's moves
+            s['choices'] = []
+        elif len(moves) == 1:
+            self._play(moves[0])
+        else:
+            s['choices'] = moves
+
+    def _play(self, move):
+        s = self.state
+        s['choices'] = []
 
         # Apply the move
         s['board'] = apply_move(s['board'], move)
@@ -447,43 +684,37 @@ class CheckersGame:
         else:
             s['moves_no_cap'] += 1
 
-        # Check for follow-up captures (multi-jump)
-        follow_up = capture_moves(s['board'], r, c) if move['is_capture'] else []
-
-        if follow_up:
-            s['must_continue'] = True
-            s['chain_piece']   = (r, c)
-            s['selected']      = (r, c)
-            s['legal_moves']   = follow_up
-        else:
-            s['must_continue'] = False
-            s['chain_piece']   = None
-            s['selected']      = None
-            s['legal_moves']   = []
-            # Switch player
-            s['current_player'] = opponent(s['current_player'])
-            # Check game over
-            over, result = check_game_over(s['board'], s['current_player'],
-                                           s['moves_no_cap'])
-            if over:
-                s['status'] = 'finished'
-                s['result'] = result
+        # Capture moves are complete chains, so every move ends the turn
+        s['selected']    = None
+        s['legal_moves'] = []
+        # Switch player
+        s['current_player'] = opponent(s['current_player'])
+        # Check game over
+        over, result = check_game_over(s['board'], s['current_player'],
+                                       s['moves_no_cap'], self.rules)
+        if over:
+            s['status'] = 'finished'
+            s['result'] = result
 
     # ── Render ─────────────────────────────────
     def render(self):
         s = self.state
         self.screen.fill(C_BG)
 
-        draw_board(self.screen)
+        draw_board(self.screen, self.rules.size)
 
         if s['selected'] and s['legal_moves']:
-            draw_highlights(self.screen, s['legal_moves'], s['selected'])
+            draw_highlights(self.screen, s['choices'] or s['legal_moves'],
+                            s['selected'], self.cell)
 
-        for r in range(BOARD_SIZE):
-            for c in range(BOARD_SIZE):
+        for r in range(self.rules.size):
+            for c in range(self.rules.size):
                 piece = s['board'][r][c]
                 if piece:
-                    draw_piece(self.screen, piece, r, c)
+                    draw_piece(self.screen, piece, r, c, cell=self.cell)
+
+        if s['choices']:
+            draw_choices(self.screen, s['choices'], self.cell)
 
         draw_panel(self.screen, s)
 
@@ -506,17 +737,23 @@ class CheckersGame:
                         self.reset()
 
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    self.handle_click(*event.pos)
+                    with self.tick_timer:
+                        self.handle_click(*event.pos)
 
             self.render()
             self.clock.tick(FPS)
+            self.frame_timer.tick()
 
 
 # ──────────────────────────────────────────────
 # Entry point
 # ──────────────────────────────────────────────
 def main():
-    game = CheckersGame()
+    parser = argparse.ArgumentParser(description='Checkers — Olos Gaming')
+    parser.add_argument('--variant', choices=sorted(VARIANTS), default=ENGLISH.name,
+                        help='rule set to play (default: english)')
+    args = parser.parse_args()
+    game = CheckersGame(VARIANTS[args.variant])
     game.run()
 
 
@@ -0,0 +1,211 @@
+"""Compact binary encoding of chess positions for match sync.
+
+Positions go in and come out as FEN strings, the form ChessEngine uses.
+
+Snapshot layout (little-endian):
+    Q  occupancy bitboard (bit 0 = a1 ... bit 63 = h8)
+    B  flags: bit 0 = black to move, bits 1-4 = castling K, Q, k, q
+    B  en-passant square index, 0xFF for none
+    H  halfmove clock
+    H  fullmove number
+    then one 4-bit piece code per occupied square, in square order, two
+    per byte (PNBRQK = 1-6, +8 for black). The start position is 30 bytes.
+
+Delta layout (against the previous position):
+    B flags  B en-passant  H halfmove  H fullmove  B changed-square count
+    then one (square index, piece code) byte pair per changed square,
+    code 0 meaning the square is now empty.
+
+Run this module to benchmark sizes and throughput against JSON:
+    python chess_codec.py
+"""
+
+import json
+import random
+import struct
+import time
+
+import chess
+
+_HEADER = struct.Struct('<QBBHH')
+_DELTA_HEADER = struct.Struct('<BBHHB')
+
+PIECE_CODES = {'P': 1, 'N': 2, 'B': 3, 'R': 4, 'Q': 5, 'K': 6,
+               'p': 9, 'n': 10, 'b': 11, 'r': 12, 'q': 13, 'k': 14}
+PIECE_SYMBOLS = {code: symbol for symbol, code in PIECE_CODES.items()}
+CASTLING = 'KQkq'
+NO_EP = 0xFF
+
+
+def _parse_fen(fen: str):
+    """Split a FEN into (64 piece codes, flags, ep, halfmove, fullmove)."""
+    parts = fen.split()
+    placement, turn, castling, ep = parts[:4]
+    halfmove = int(parts[4]) if len(parts) > 4 else 0
+    fullmove = int(parts[5]) if len(parts) > 5 else 1
+
+    squares = [0] * 64
+    for rank_idx, row in enumerate(placement.split('/')):
+        sq = (7 - rank_idx) * 8
+        for ch in row:
+            if ch.isdigit():
+                sq += int(ch)
+            else:
+                squares[sq] = PIECE_CODES[ch]
+                sq += 1
+
+    flags = turn == 'b'
+    for i, right in enumerate(CASTLING):
+        if right in castling:
+            flags |= 2 << i
+    ep_sq = NO_EP if ep == '-' else (int(ep[1]) - 1) * 8 + ord(ep[0]) - ord('a')
+    return squares, flags, ep_sq, halfmove, fullmove
+
+
+def _format_fen(squares, flags, ep_sq, halfmove, fullmove) -> str:
+    rows = []
+    for rank in range(7, -1, -1):
+        row, empty = '', 0
+        for code in squares[rank * 8:rank * 8 + 8]:
+            if code:
+                if empty:
+                    row += str(empty)
+                    empty = 0
+                row += PIECE_SYMBOLS[code]
+            else:
+                empty += 1
+        rows.append(row + (str(empty) if empty else ''))
+    castling = ''.join(right for i, right in enumerate(CASTLING) if flags & (2 << i)) or '-'
+    ep = '-' if ep_sq == NO_EP else 'abcdefgh'[ep_sq % 8] + str(ep_sq // 8 + 1)
+    turn = 'b' if flags & 1 else 'w'
+    return f"{'/'.join(rows)} {turn} {castling} {ep} {halfmove} {fullmove}"
+
+
+def encode(fen: str) -> bytes:
+    """Encode a FEN as a packed snapshot."""
+    squares, flags, ep_sq, halfmove, fullmove = _parse_fen(fen)
+    occupancy = 0
+    codes = []
+    for sq, code in enumerate(squares):
+        if code:
+            occupancy |= 1 << sq
+            codes.append(code)
+    if len(codes) % 2:
+        codes.append(0)
+    packed = bytes(codes[i] | codes[i + 1] << 4 for i in range(0, len(codes), 2))
+    return _HEADER.pack(occupancy, flags, ep_sq, halfmove, fullmove) + packed
+
+
+def decode(data: bytes) -> str:
+    """Inverse of encode(); returns a FEN."""
+    occupancy, flags, ep_sq, halfmove, fullmove = _HEADER.unpack_from(data)
+    nibbles = []
+    for byte in data[_HEADER.size:]:
+        nibbles.append(byte & 0x0F)
+        nibbles.append(byte >> 4)
+    squares = [0] * 64
+    i = 0
+    for sq in range(64):
+        if occupancy >> sq & 1:
+            squares[sq] = nibbles[i]
+            i += 1
+    return _format_fen(squares, flags, ep_sq, halfmove, fullmove)
+
+
+def encode_delta(prev_fen: str, fen: str) -> bytes:
+    """Encode the squares and fields that changed since prev_fen."""
+    old = _parse_fen(prev_fen)[0]
+    squares, flags, ep_sq, halfmove, fullmove = _parse_fen(fen)
+    changes = bytearray()
+    for sq in range(64):
+        if squares[sq] != old[sq]:
+            changes += bytes((sq, squares[sq]))
+    return (_DELTA_HEADER.pack(flags, ep_sq, halfmove, fullmove, len(changes) // 2)
+            + bytes(changes))
+
+
+def apply_delta(prev_fen: str, data: bytes) -> str:
+    """Return the FEN after applying a delta to prev_fen."""
+    squares = _parse_fen(prev_fen)[0]
+    flags, ep_sq, halfmove, fullmove, count = _DELTA_HEADER.unpack_from(data)
+    off = _DELTA_HEADER.size
+    for k in range(count):
+        squares[data[off + 2 * k]] = data[off + 2 * k + 1]
+    return _format_fen(squares, flags, ep_sq, halfmove, fullmove)
+
+
+# ──────────────────────────────────────────────
+# Benchmark
+# ──────────────────────────────────────────────
+def to_json(fen: str) -> str:
+    """board_state as the Python engine sends it today."""
+    return json.dumps({'fen': fen})
+
+
+def to_web_json(fen: str) -> str:
+    """board_state as the web client sends it today (8x8 {type, color} grid)."""
+    board = chess.Board(fen)
+    grid = []
+    for rank in range(7, -1, -1):
+        row = []
+        for file in range(8):
+            piece = board.piece_at(chess.square(file, rank))
+            row.append({'type': piece.symbol().upper(),
+                        'color': 'w' if piece.color else 'b'} if piece else None)
+        grid.append(row)
+    return json.dumps(grid)
+
+
+def _sample_games(games: int = 30, seed: int = 1):
+    """FEN sequences from random legal games."""
+    rng = random.Random(seed)
+    runs = []
+    for _ in range(games):
+        board = chess.Board()
+        run = [board.fen()]
+        while not board.is_game_over() and len(run) < 150:
+            board.push(rng.choice(list(board.legal_moves)))
+            run.append(board.fen())
+        runs.append(run)
+    return runs
+
+
+def _rate(fn, items, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            fn(*item)
+        best = min(best, time.perf_counter() - start)
+    return len(items) / best
+
+
+def benchmark():
+    runs = _sample_games()
+    fens = [f for run in runs for f in run]
+    pairs = [(a, b) for run in runs for a, b in zip(run, run[1:])]
+    snaps = [encode(f) for f in fens]
+    deltas = [(a, encode_delta(a, b)) for a, b in pairs]
+
+    def avg(sizes):
+        sizes = list(sizes)
+        return sum(sizes) / len(sizes)
+
+    fen_size = avg(len(to_json(f).encode()) for f in fens)
+    web_size = avg(len(to_web_json(f).encode()) for f in fens)
+    snap_size = avg(map(len, snaps))
+    delta_size = avg(len(d) for _, d in deltas)
+    print(f'chess: {len(fens)} positions from {len(runs)} games')
+    print(f'  json board grid {web_size:8.1f} B')
+    print(f'  json fen        {fen_size:8.1f} B')
+    print(f'  binary snapshot {snap_size:8.1f} B  ({fen_size / snap_size:5.1f}x smaller than fen)')
+    print(f'  binary delta    {delta_size:8.1f} B  ({fen_size / delta_size:5.1f}x smaller than fen)')
+    print(f'  json encode     {_rate(to_json, [(f,) for f in fens]):12,.0f} /s')
+    print(f'  encode          {_rate(encode, [(f,) for f in fens]):12,.0f} /s')
+    print(f'  decode          {_rate(decode, [(d,) for d in snaps]):12,.0f} /s')
+    print(f'  encode_delta    {_rate(encode_delta, pairs):12,.0f} /s')
+    print(f'  apply_delta     {_rate(apply_delta, deltas):12,.0f} /s')
+
+
+if __name__ == '__main__':
+    benchmark()
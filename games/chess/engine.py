@@ -1,9 +1,20 @@
 
 import chess
 
+PIECE_VALUES = {
+    chess.PAWN: 100,
+    chess.KNIGHT: 320,
+    chess.BISHOP: 330,
+    chess.ROOK: 500,
+    chess.QUEEN: 900,
+    chess.KING: 0,
+}
+MATE_SCORE = 100_000
+
 class ChessEngine:
-    def __init__(self):
+    def __init__(self, cache=None):
         self.board = chess.Board()
+        self.cache = cache
 
     def make_move(self, uci_move: str):
         move = chess.Move.from_uci(uci_move)
@@ -15,5 +26,57 @@ class ChessEngine:
     def get_fen(self):
         return self.board.fen()
 
+    def set_fen(self, fen: str):
+        self.board.set_fen(fen)
+
     def reset(self):
         self.board.reset()
+
+    def evaluate(self):
+        """Material balance in centipawns from the side to move's view."""
+        score = 0
+        for piece_type, value in PIECE_VALUES.items():
+            score += value * (len(self.board.pieces(piece_type, chess.WHITE))
+                              - len(self.board.pieces(piece_type, chess.BLACK)))
+        return score if self.board.turn == chess.WHITE else -score
+
+    def analyse(self, depth: int = 3):
+        """Search the current position; returns (score, best_move_uci).
+
+        Results are served from / stored in self.cache when one is set.
+        """
+        if self.cache is not None:
+            cached = self.cache.get(self.board, depth)
+            if cached is not None:
+                return cached
+
+        score, best = self._negamax(depth, -MATE_SCORE - 1, MATE_SCORE + 1, 0)
+        best_uci = best.uci() if best else None
+
+        if self.cache is not None:
+            self.cache.put(self.board, depth, score, best_uci)
+        return score, best_uci
+
+    def _negamax(self, depth, alpha, beta, ply):
+        board = self.board
+        if board.is_checkmate():
+            return -MATE_SCORE + ply, None
+        if board.is_stalemate() or board.is_insufficient_material():
+            return 0, None
+        if depth == 0:
+            return self.evaluate(), None
+
+        best_move = None
+        # Captures first: cheap ordering that makes alpha-beta cut earlier
+        moves = sorted(board.legal_moves, key=board.is_capture, reverse=True)
+        for move in moves:
+            board.push(move)
+            score = -self._negamax(depth - 1, -beta, -alpha, ply + 1)[0]
+            board.pop()
+            if score > alpha:
+                alpha, best_move = score, move
+                if alpha >= beta:
+                    break
+        if best_move is None:
+            best_move = moves[0]
+        return alpha, best_move
@@ -0,0 +1,172 @@
+import sqlite3
+from collections import OrderedDict
+
+import chess
+import chess.pgn
+import chess.polyglot
+
+from engine import ChessEngine
+
+_UPSERT = (
+    'INSERT INTO evals (key, depth, score, best_move) VALUES (?, ?, ?, ?) '
+    'ON CONFLICT(key) DO UPDATE SET depth = excluded.depth,'
+    ' score = excluded.score, best_move = excluded.best_move '
+    'WHERE excluded.depth >= evals.depth'
+)
+
+def position_key(board: chess.Board) -> int:
+    """Zobrist hash of a position, folded into SQLite's signed 64-bit range."""
+    key = chess.polyglot.zobrist_hash(board)
+    return key - (1 << 64) if key >= (1 << 63) else key
+
+
+class EvalCache:
+    """Two-tier cache of analysis results keyed by Zobrist hash.
+
+    The front tier is an in-memory LRU; the back tier is a SQLite file
+    (memory-mapped reads, WAL journal) that survives restarts. An entry
+    searched to depth d answers any request for depth <= d, and a stored
+    entry is only replaced by one searched at least as deep.
+
+    New results are buffered and written in one short transaction per
+    flush(), so processes sharing the file only hold the write lock
+    briefly. A locked database is treated as a miss, never as an error.
+    """
+
+    def __init__(self, path: str = ':memory:', capacity: int = 100_000,
+                 commit_every: int = 256):
+        self.capacity = capacity
+        self.commit_every = commit_every
+        self.lru = OrderedDict()      # key -> (depth, score, best_move)
+        self.pending = {}             # key -> entry not yet written to disk
+        self.hits = 0
+        self.misses = 0
+
+        # Generous lock timeout: batch workers may share one cache file
+        self.db = sqlite3.connect(path, timeout=30)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.execute('PRAGMA mmap_size=268435456')
+        self.db.execute(
+            'CREATE TABLE IF NOT EXISTS evals ('
+            ' key INTEGER PRIMARY KEY,'
+            ' depth INTEGER NOT NULL,'
+            ' score INTEGER NOT NULL,'
+            ' best_move TEXT)'
+        )
+
+    def _remember(self, key, entry):
+        self.lru[key] = entry
+        self.lru.move_to_end(key)
+        if len(self.lru) > self.capacity:
+            self.lru.popitem(last=False)
+
+    def _load(self, key):
+        try:
+            return self.db.execute(
+                'SELECT depth, score, best_move FROM evals WHERE key = ?', (key,)
+            ).fetchone()
+        except sqlite3.OperationalError:
+            # Busy past the lock timeout: fall back to what is in memory
+            return None
+
+    def get(self, board: chess.Board, depth: int):
+        """Return (score, best_move_uci) searched to at least depth, or None."""
+        key = position_key(board)
+        entry = self.lru.get(key)
+        if entry is not None:
+            self.lru.move_to_end(key)
+        if entry is None or entry[0] < depth:
+            # Another process sharing the file may have stored a deeper result
+            row = self._load(key)
+            if row is not None and (entry is None or row[0] > entry[0]):
+                entry = row
+                self._remember(key, entry)
+
+        if entry is None or entry[0] < depth:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1], entry[2]
+
+    def put(self, board: chess.Board, depth: int, score: int, best_move):
+        """Store a result unless a deeper one is already known."""
+        key = position_key(board)
+        # Check every tier: the LRU copy can be older than the row on disk
+        current = self._load(key)
+        for known in (self.lru.get(key), self.pending.get(key)):
+            if known is not None and (current is None or known[0] > current[0]):
+                current = known
+        if current is not None and current[0] > depth:
+            self._remember(key, current)
+            return
+        entry = (depth, score, best_move)
+        self._remember(key, entry)
+        self.pending[key] = entry
+        if len(self.pending) >= self.commit_every:
+            self.flush()
+
+    def preload(self, limit: int = None):
+        """Fill the LRU from disk, deepest entries first."""
+        limit = self.capacity if limit is None else min(limit, self.capacity)
+        rows = self.db.execute(
+            'SELECT key, depth, score, best_move FROM evals '
+            'ORDER BY depth DESC LIMIT ?', (limit,)
+        )
+        loaded = 0
+        for key, depth, score, best_move in reversed(rows.fetchall()):
+            self._remember(key, (depth, score, best_move))
+            loaded += 1
+        return loaded
+
+    def warm_up(self, pgn_path: str, depth: int):
+        """Analyse every position of every game in a PGN archive.
+
+        Positions already cached at this depth are skipped, so re-running
+        the warm-up over a growing archive only analyses new positions.
+        Returns the number of positions analysed.
+        """
+        engine = ChessEngine(cache=self)
+        analysed = 0
+        with open(pgn_path) as f:
+            while True:
+                game = chess.pgn.read_game(f)
+                if game is None:
+                    break
+                board = game.board()
+                for move in [None] + list(game.mainline_moves()):
+                    if move is not None:
+                        board.push(move)
+                    # analyse() checks the cache itself; count it as analysed
+                    # only if that check missed
+                    misses = self.misses
+                    engine.board = board.copy(stack=False)
+                    engine.analyse(depth)
+                    analysed += self.misses - misses
+        self.flush()
+        return analysed
+
+    def flush(self):
+        """Write buffered results; they stay buffered if the file is locked."""
+        if not self.pending:
+            return
+        rows = [(key,) + entry for key, entry in self.pending.items()]
+        try:
+            with self.db:
+                self.db.executemany(_UPSERT, rows)
+        except sqlite3.OperationalError:
+            return
+        self.pending.clear()
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.db.execute('SELECT COUNT(*) FROM evals').fetchone()[0]
@@ -1,6 +1,142 @@
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import chess
+
+from engine import ChessEngine
+
+_worker_engine = None
+
+
+def parse_position(line: str) -> chess.Board:
+    """A FEN, or space-separated UCI moves played from the start position."""
+    if '/' in line:
+        return chess.Board(line)
+    board = chess.Board()
+    for uci in line.split():
+        board.push_uci(uci)
+    return board
+
+
+def _init_worker(cache_path):
+    global _worker_engine
+    cache = None
+    if cache_path:
+        from eval_cache import EvalCache
+        cache = EvalCache(cache_path)
+    _worker_engine = ChessEngine(cache=cache)
+
+
+def analyse_chunk(chunk, depth: int):
+    """Analyse a list of (index, line) pairs in a worker process."""
+    engine = _worker_engine
+    results = []
+    for index, line in chunk:
+        try:
+            engine.board = parse_position(line)
+        except ValueError as e:
+            results.append({'index': index, 'input': line, 'error': str(e)})
+            continue
+        score, best_move = engine.analyse(depth)
+        results.append({'index': index, 'fen': engine.get_fen(),
+                        'score': score, 'best_move': best_move})
+    if engine.cache is not None:
+        engine.cache.flush()
+    return results
+
+
+def read_chunks(lines, chunk_size: int):
+    """Yield lists of (index, line) pairs, skipping blank lines and comments."""
+    numbered = ((i, line.strip()) for i, line in enumerate(lines))
+    positions = ((i, line) for i, line in numbered
+                 if line and not line.startswith('#'))
+    while True:
+        chunk = list(islice(positions, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def batch_analyse(lines, out, depth: int = 3, workers: int = None,
+                  chunk_size: int = 64, max_pending: int = None,
+                  cache_path: str = None, progress=sys.stderr):
+    """Analyse positions across a process pool, writing JSON lines to out in input order.
+
+    At most max_pending chunks are in flight at once; the reader blocks on
+    the oldest one before submitting more, so memory stays flat however
+    large the input is.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 2
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(cache_path,)) as pool:
+        pending = deque()
+        done = 0
+        start = last_report = time.perf_counter()
+
+        def drain_one():
+            nonlocal done, last_report
+            for result in pending.popleft().result():
+                out.write(json.dumps(result) + '\n')
+                done += 1
+            now = time.perf_counter()
+            if progress and now - last_report >= 1.0:
+                last_report = now
+                progress.write(f'\r{done} positions, {done / (now - start):.1f}/s')
+                progress.flush()
+
+        for chunk in read_chunks(lines, chunk_size):
+            if len(pending) >= max_pending:
+                drain_one()
+            pending.append(pool.submit(analyse_chunk, chunk, depth))
+        while pending:
+            drain_one()
+
+    elapsed = time.perf_counter() - start
+    if progress:
+        rate = done / elapsed if elapsed else 0.0
+        progress.write(f'\r{done} positions in {elapsed:.1f}s ({rate:.1f}/s)\n')
+    return done
+
 
 def main():
-    print("Chess Python Engine Initialized")
+    parser = argparse.ArgumentParser(description='Chess Python Engine')
+    sub = parser.add_subparsers(dest='command')
+
+    batch = sub.add_parser('analyse', help='batch-analyse FENs or move lists from a file')
+    batch.add_argument('input', help="one FEN or UCI move list per line ('-' for stdin)")
+    batch.add_argument('-o', '--output', help='JSON lines output file (default: stdout)')
+    batch.add_argument('-d', '--depth', type=int, default=3)
+    batch.add_argument('-w', '--workers', type=int, default=None,
+                       help='worker processes (default: CPU count)')
+    batch.add_argument('--chunk-size', type=int, default=64,
+                       help='positions per work unit')
+    batch.add_argument('--max-pending', type=int, default=None,
+                       help='work units in flight before reading pauses (default: 2 x workers)')
+    batch.add_argument('--cache', help='EvalCache SQLite file shared by the workers')
+
+    args = parser.parse_args()
+    if args.command != 'analyse':
+        print("Chess Python Engine Initialized")
+        return
+
+    src = sys.stdin if args.input == '-' else open(args.input)
+    out = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        batch_analyse(src, out, depth=args.depth, workers=args.workers,
+                      chunk_size=args.chunk_size, max_pending=args.max_pending,
+                      cache_path=args.cache)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if out is not sys.stdout:
+            out.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,245 @@
+"""
+Opt-in profiling hooks shared by the game engines
+
+Instrumentation is switched on with the OLOS_PROFILE environment variable
+(any value other than empty / "0"). When it is off, @instrument returns the
+original function untouched and the frame/tick timers are no-ops, so the
+hot paths pay nothing.
+
+Collected metrics can be exported as Prometheus text or as a JSON snapshot.
+Set OLOS_PROFILE_OUT to a file path to write one automatically at exit
+(".json" selects JSON, anything else Prometheus text).
+"""
+
+import atexit
+import bisect
+import functools
+import json
+import os
+import threading
+import time
+
+ENABLED = os.environ.get('OLOS_PROFILE', '') not in ('', '0')
+
+# Histogram bucket upper bounds, in seconds (10us .. 1s)
+BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+           0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+# Metric kinds, each exported as its own Prometheus family
+CALL  = 'call'
+FRAME = 'frame'
+TICK  = 'tick'
+
+_FAMILIES = {
+    CALL:  ('olos_call_seconds', 'Latency of instrumented engine functions'),
+    FRAME: ('olos_frame_seconds', 'Time between two frames of a game loop'),
+    TICK:  ('olos_tick_seconds', 'Time spent in one game-state tick'),
+}
+
+_lock = threading.Lock()
+_metrics = {}
+
+
+class Histogram:
+    """Call count and latency distribution for one instrumented name"""
+
+    __slots__ = ('name', 'kind', 'counts', 'count', 'total', 'max')
+
+    def __init__(self, name, kind):
+        self.name = name
+        self.kind = kind
+        self.counts = [0] * (len(BUCKETS) + 1)   # last bucket is +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def clear(self):
+        """Zero the histogram in place; wrappers and timers keep their reference"""
+        self.counts[:] = [0] * len(self.counts)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q):
+        """Approximate quantile, reported as the upper bound of its bucket"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= target:
+                return BUCKETS[i] if i < len(BUCKETS) else self.max
+        return self.max
+
+    def to_dict(self):
+        return {
+            'kind': self.kind,
+            'count': self.count,
+            'sum': self.total,
+            'mean': self.total / self.count if self.count else 0.0,
+            'max': self.max,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+            'buckets': {str(le): n for le, n in zip(BUCKETS, self.counts)},
+            'overflow': self.counts[-1],
+        }
+
+
+def histogram(name, kind=CALL):
+    """Return the histogram registered under name, creating it if needed"""
+    hist = _metrics.get(name)
+    if hist is None:
+        with _lock:
+            hist = _metrics.setdefault(name, Histogram(name, kind))
+    return hist
+
+
+def observe(name, seconds, kind=CALL):
+    """Record a single measurement (no-op when instrumentation is off)"""
+    if ENABLED:
+        histogram(name, kind).observe(seconds)
+
+
+def instrument(name=None):
+    """Decorator recording call count and latency of the wrapped function
+
+    Returns the function itself when instrumentation is disabled, so the
+    decision is made once at import time rather than on every call.
+    """
+    def decorator(fn):
+        if not ENABLED:
+            return fn
+        hist = histogram(name or f'{fn.__module__}.{fn.__qualname__}', CALL)
+        clock = time.perf_counter
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                hist.observe(clock() - start)
+        return wrapper
+    return decorator
+
+
+class _NullTimer:
+    """Stand-in used when instrumentation is disabled"""
+
+    def tick(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class FrameTimer:
+    """Records the wall time between consecutive tick() calls of a loop"""
+
+    def __init__(self, name):
+        self.hist = histogram(name, FRAME)
+        self.last = None
+
+    def tick(self):
+        now = time.perf_counter()
+        if self.last is not None:
+            self.hist.observe(now - self.last)
+        self.last = now
+
+
+class TickTimer:
+    """Context manager recording how long one game-state tick takes"""
+
+    def __init__(self, name):
+        self.hist = histogram(name, TICK)
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.hist.observe(time.perf_counter() - self.start)
+        return False
+
+
+def frame_timer(name):
+    """FrameTimer for name, or a shared no-op timer when disabled"""
+    return FrameTimer(name) if ENABLED else _NULL_TIMER
+
+
+def tick_timer(name):
+    """TickTimer for name, or a shared no-op timer when disabled"""
+    return TickTimer(name) if ENABLED else _NULL_TIMER
+
+
+def reset():
+    """Drop every collected measurement"""
+    with _lock:
+        for hist in _metrics.values():
+            hist.clear()
+
+
+# ──────────────────────────────────────────────
+# Export
+# ──────────────────────────────────────────────
+def snapshot():
+    """JSON-serialisable dict of every metric"""
+    return {
+        'timestamp': time.time(),
+        'metrics': {name: hist.to_dict() for name, hist in sorted(_metrics.items())},
+    }
+
+
+def prometheus_text():
+    """Render every metric in the Prometheus text exposition format"""
+    lines = []
+    for kind, (family, help_text) in _FAMILIES.items():
+        hists = [h for _, h in sorted(_metrics.items()) if h.kind == kind]
+        if not hists:
+            continue
+        lines.append(f'# HELP {family} {help_text}')
+        lines.append(f'# TYPE {family} histogram')
+        for hist in hists:
+            label = f'name="{hist.name}"'
+            cumulative = 0
+            for le, n in zip(BUCKETS, hist.counts):
+                cumulative += n
+                lines.append(f'{family}_bucket{{{label},le="{le}"}} {cumulative}')
+            lines.append(f'{family}_bucket{{{label},le="+Inf"}} {hist.count}')
+            lines.append(f'{family}_sum{{{label}}} {hist.total}')
+            lines.append(f'{family}_count{{{label}}} {hist.count}')
+    return '\n'.join(lines) + '\n'
+
+
+def export(path):
+    """Write metrics to path, JSON if it ends in .json, Prometheus text otherwise"""
+    if path.endswith('.json'):
+        data = json.dumps(snapshot(), indent=2)
+    else:
+        data = prometheus_text()
+    # Write-then-rename so a scraping node-exporter never sees a partial file
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+_out = os.environ.get('OLOS_PROFILE_OUT')
+if ENABLED and _out:
+    atexit.register(export, _out)
@@ -0,0 +1,345 @@
+"""
+Multiplayer arena mode for Snake
+Hundreds of snakes and many food items share one large grid. Collisions are
+resolved against a shared occupancy grid, so each head check is a single
+lookup no matter how many snakes are alive, and rendering only touches the
+cells inside the camera viewport.
+"""
+
+import os
+import random
+import sys
+from collections import deque
+
+import pygame
+
+# Shared helpers (instrumentation) live one level up in games/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from instrumentation import instrument, frame_timer, tick_timer
+from snake_game import (WINDOW_WIDTH, WINDOW_HEIGHT, GRID_SIZE, GRID_WIDTH, GRID_HEIGHT,
+                        BLACK, WHITE, RED, YELLOW, GRAY, UP, DOWN, LEFT, RIGHT)
+
+# Arena constants
+ARENA_WIDTH = 200
+ARENA_HEIGHT = 200
+ARENA_BOTS = 300
+ARENA_FOOD = 800
+ARENA_SPEED = 12
+START_LENGTH = 3
+
+DIRECTIONS = (UP, DOWN, LEFT, RIGHT)
+
+# Snake colors (body, head); the player always uses the first entry
+PALETTE = [
+    ((0, 255, 0), (0, 200, 0)),
+    ((80, 160, 255), (40, 110, 220)),
+    ((255, 160, 40), (220, 120, 20)),
+    ((200, 90, 255), (150, 50, 210)),
+    ((255, 90, 160), (210, 50, 120)),
+    ((90, 230, 220), (40, 180, 170)),
+]
+
+
+class ArenaSnake:
+    """One snake in the arena, body stored as flat cell indices (head first)"""
+
+    def __init__(self, snake_id, body, direction):
+        """Create a snake from a list of cell indices and a heading"""
+        self.id = snake_id
+        self.body = deque(body)
+        self.direction = direction
+        self.alive = True
+        self.grow_pending = False
+        self.score = 0
+        palette_idx = 1 + (snake_id - 1) % (len(PALETTE) - 1) if snake_id else 0
+        self.color, self.head_color = PALETTE[palette_idx]
+
+    @property
+    def length(self):
+        return len(self.body)
+
+    def get_head_index(self):
+        """Return the flat cell index of the head"""
+        return self.body[0]
+
+    def change_direction(self, new_direction):
+        """Change direction if not opposite to current direction"""
+        if (new_direction[0] * -1, new_direction[1] * -1) != self.direction:
+            self.direction = new_direction
+
+
+class Arena:
+    """Shared grid holding every snake and food item
+
+    `grid` has one entry per cell: 0 when empty, otherwise the id + 1 of the
+    snake whose body covers it. Food lives in a separate set of cell indices.
+    """
+
+    def __init__(self, width=ARENA_WIDTH, height=ARENA_HEIGHT, food_count=ARENA_FOOD, seed=None):
+        """Create an empty arena and scatter its food"""
+        self.width = width
+        self.height = height
+        self.grid = [0] * (width * height)
+        self.food = set()
+        self.food_count = food_count
+        self.snakes = {}
+        self.next_id = 0
+        self.tick_count = 0
+        self.rng = random.Random(seed)
+        for _ in range(food_count):
+            self.spawn_food()
+
+    def index(self, x, y):
+        return y * self.width + x
+
+    def position(self, idx):
+        """Return (x, y) for a flat cell index"""
+        y, x = divmod(idx, self.width)
+        return x, y
+
+    def is_free(self, idx):
+        return self.grid[idx] == 0
+
+    def spawn_food(self):
+        """Drop one food item on a random empty cell"""
+        cells = self.width * self.height
+        for _ in range(100):
+            idx = self.rng.randrange(cells)
+            if self.grid[idx] == 0 and idx not in self.food:
+                self.food.add(idx)
+                return idx
+        return None   # arena is effectively full
+
+    def add_snake(self, length=START_LENGTH):
+        """Spawn a snake on a random free straight run of cells, None if no room"""
+        for _ in range(100):
+            direction = self.rng.choice(DIRECTIONS)
+            x = self.rng.randrange(length, self.width - length)
+            y = self.rng.randrange(length, self.height - length)
+            cells = [self.index(x - direction[0] * i, y - direction[1] * i)
+                     for i in range(length)]
+            if all(self.grid[c] == 0 and c not in self.food for c in cells):
+                snake = ArenaSnake(self.next_id, cells, direction)
+                self.next_id += 1
+                for c in cells:
+                    self.grid[c] = snake.id + 1
+                self.snakes[snake.id] = snake
+                return snake
+        return None
+
+    def remove_snake(self, snake):
+        """Clear a snake's body from the grid and drop it from the arena"""
+        for c in snake.body:
+            if self.grid[c] == snake.id + 1:
+                self.grid[c] = 0
+        snake.alive = False
+        self.snakes.pop(snake.id, None)
+
+    @instrument('snake.Arena.step')
+    def step(self):
+        """Advance every snake by one cell and resolve collisions
+
+        Returns the list of snakes that died this tick.
+        """
+        self.tick_count += 1
+        width, height, grid = self.width, self.height, self.grid
+        targets = {}
+        dead = []
+
+        # Work out each head's target cell; leaving the arena is fatal
+        for snake in self.snakes.values():
+            hy, hx = divmod(snake.body[0], width)
+            nx, ny = hx + snake.direction[0], hy + snake.direction[1]
+            if 0 <= nx < width and 0 <= ny < height:
+                targets.setdefault(ny * width + nx, []).append(snake)
+            else:
+                dead.append(snake)
+
+        # Tails move out first, so a head may follow any tail into its cell
+        for snake in self.snakes.values():
+            if snake.grow_pending:
+                snake.grow_pending = False
+            else:
+                grid[snake.body.pop()] = 0
+
+        for target, movers in targets.items():
+            # Head-to-head: everyone entering the same cell dies
+            if len(movers) > 1:
+                dead.extend(movers)
+                continue
+            snake = movers[0]
+            # Head-to-body: one lookup in the shared occupancy grid
+            if grid[target]:
+                dead.append(snake)
+                continue
+            snake.body.appendleft(target)
+            grid[target] = snake.id + 1
+            if target in self.food:
+                self.food.discard(target)
+                snake.grow_pending = True
+                snake.score += 10
+                self.spawn_food()
+
+        for snake in dead:
+            self.remove_snake(snake)
+        return dead
+
+    @instrument('snake.Arena.draw')
+    def draw(self, surface, viewport):
+        """Draw only the cells inside viewport = (x0, y0, cols, rows)"""
+        x0, y0, cols, rows = viewport
+        x1 = min(x0 + cols, self.width)
+        y1 = min(y0 + rows, self.height)
+        x0, y0 = max(x0, 0), max(y0, 0)
+        grid, food, snakes = self.grid, self.food, self.snakes
+
+        for y in range(y0, y1):
+            base = y * self.width
+            py = (y - y0) * GRID_SIZE
+            for x in range(x0, x1):
+                idx = base + x
+                owner = grid[idx]
+                if owner:
+                    snake = snakes[owner - 1]
+                    rect = pygame.Rect((x - x0) * GRID_SIZE, py, GRID_SIZE - 1, GRID_SIZE - 1)
+                    if snake.body[0] == idx:
+                        pygame.draw.rect(surface, snake.head_color, rect)
+                        pygame.draw.rect(surface, snake.color, rect, 2)
+                    else:
+                        pygame.draw.rect(surface, snake.color, rect)
+                elif idx in food:
+                    rect = pygame.Rect((x - x0) * GRID_SIZE, py, GRID_SIZE - 1, GRID_SIZE - 1)
+                    pygame.draw.rect(surface, RED, rect)
+
+
+def wander(arena, snake):
+    """Simple bot: keep heading unless blocked, occasionally turn at random"""
+    hx, hy = arena.position(snake.get_head_index())
+    options = [snake.direction] if arena.rng.random() > 0.1 else []
+    options += arena.rng.sample(DIRECTIONS, len(DIRECTIONS))
+    for d in options:
+        if (d[0] * -1, d[1] * -1) == snake.direction:
+            continue
+        nx, ny = hx + d[0], hy + d[1]
+        if (0 <= nx < arena.width and 0 <= ny < arena.height
+                and arena.is_free(arena.index(nx, ny))):
+            snake.change_direction(d)
+            return
+
+
+class ArenaGame:
+    """Pygame front end: one player snake among many bots, camera follows the player"""
+
+    KEYS = {
+        pygame.K_UP: UP, pygame.K_w: UP,
+        pygame.K_DOWN: DOWN, pygame.K_s: DOWN,
+        pygame.K_LEFT: LEFT, pygame.K_a: LEFT,
+        pygame.K_RIGHT: RIGHT, pygame.K_d: RIGHT,
+    }
+
+    def __init__(self, bots=ARENA_BOTS):
+        """Initialize game window and arena"""
+        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        pygame.display.set_caption("Snake Arena")
+        self.clock = pygame.time.Clock()
+        self.font = pygame.font.Font(None, 36)
+        self.small_font = pygame.font.Font(None, 24)
+        self.bots = bots
+        self.frame_timer = frame_timer('snake.arena.frame')
+        self.tick_timer = tick_timer('snake.arena.tick')
+        self.reset_game()
+
+    def reset_game(self):
+        """Start a fresh arena with the player and a full set of bots"""
+        self.arena = Arena()
+        self.player = self.arena.add_snake()
+        for _ in range(self.bots):
+            self.arena.add_snake()
+        self.game_over = False
+
+    def viewport(self):
+        """Camera rectangle in cells, centred on the player and clamped to the arena"""
+        hx, hy = self.arena.position(self.player.get_head_index())
+        x0 = min(max(hx - GRID_WIDTH // 2, 0), self.arena.width - GRID_WIDTH)
+        y0 = min(max(hy - GRID_HEIGHT // 2, 0), self.arena.height - GRID_HEIGHT)
+        return x0, y0, GRID_WIDTH, GRID_HEIGHT
+
+    def handle_input(self):
+        """Handle keyboard input, returns False to quit"""
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+            if event.type == pygame.KEYDOWN:
+                if event.key in (pygame.K_ESCAPE, pygame.K_q):
+                    return False
+                if self.game_over:
+                    if event.key in (pygame.K_SPACE, pygame.K_RETURN):
+                        self.reset_game()
+                elif event.key in self.KEYS:
+                    self.player.change_direction(self.KEYS[event.key])
+        return True
+
+    def update(self):
+        """Steer the bots, advance the arena and refill it"""
+        if self.game_over:
+            return
+        for snake in self.arena.snakes.values():
+            if snake is not self.player:
+                wander(self.arena, snake)
+        self.arena.step()
+        if not self.player.alive:
+            self.game_over = True
+        # Keep the lobby full
+        while len(self.arena.snakes) < self.bots + (0 if self.game_over else 1):
+            if not self.arena.add_snake():
+                break
+
+    def draw(self):
+        """Draw the visible part of the arena and the HUD"""
+        self.screen.fill(BLACK)
+        x0, y0, cols, rows = viewport = self.viewport()
+        self.arena.draw(self.screen, viewport)
+
+        # Arena border, if it is in view
+        border = pygame.Rect(-x0 * GRID_SIZE, -y0 * GRID_SIZE,
+                             self.arena.width * GRID_SIZE, self.arena.height * GRID_SIZE)
+        pygame.draw.rect(self.screen, GRAY, border, 2)
+
+        score_text = self.small_font.render(f"Score: {self.player.score}", True, WHITE)
+        self.screen.blit(score_text, (10, 10))
+        alive_text = self.small_font.render(f"Snakes: {len(self.arena.snakes)}", True, WHITE)
+        self.screen.blit(alive_text, (WINDOW_WIDTH - 130, 10))
+
+        if self.game_over:
+            game_over_text = self.font.render("GAME OVER", True, RED)
+            restart_text = self.small_font.render("Press SPACE to Restart", True, YELLOW)
+            self.screen.blit(game_over_text,
+                             (WINDOW_WIDTH // 2 - game_over_text.get_width() // 2, 150))
+            self.screen.blit(restart_text,
+                             (WINDOW_WIDTH // 2 - restart_text.get_width() // 2, 200))
+
+        pygame.display.flip()
+
+    def run(self):
+        """Main game loop"""
+        running = True
+        while running:
+            running = self.handle_input()
+            with self.tick_timer:
+                self.update()
+            self.draw()
+            self.clock.tick(ARENA_SPEED)
+            self.frame_timer.tick()
+
+        pygame.quit()
+        sys.exit()
+
+
+def main():
+    """Entry point for arena mode"""
+    game = ArenaGame()
+    game.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Autopilot policy for Snake bots
+Plans toward the food with a BFS distance field that is reused between ticks,
+checks that the tail stays reachable before committing to a path, and falls
+back to a Hamiltonian cycle when no safe path exists.
+
+The policy only reads `snake.positions`, `snake.direction`, `snake.grow_pending`
+and the food position, so it works with any grid size.
+"""
+
+from collections import deque
+from functools import lru_cache
+
+# Same values as the direction constants in snake_game
+STEPS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+# Ticks to stay on the fallback route before trying to plan to the food again
+REPLAN_INTERVAL = 8
+
+# Reachability searches per fallback decision; keeps the worst tick bounded
+MAX_FALLBACK_SEARCHES = 2
+
+
+@lru_cache(maxsize=None)
+def neighbour_table(width, height):
+    """For every flat cell index, the list of (neighbour index, step) pairs"""
+    table = []
+    for idx in range(width * height):
+        y, x = divmod(idx, width)
+        cells = []
+        for step in STEPS:
+            nx, ny = x + step[0], y + step[1]
+            if 0 <= nx < width and 0 <= ny < height:
+                cells.append((ny * width + nx, step))
+        table.append(tuple(cells))
+    return tuple(table)
+
+
+@lru_cache(maxsize=None)
+def hamiltonian_cycle(width, height):
+    """Successor of every cell on a Hamiltonian cycle, or None if none exists
+
+    Built as a boustrophedon over columns 1..w-1 that returns home along
+    column 0; this needs an even height (the grid is transposed if only the
+    width is even). Grids with both sides odd have no Hamiltonian cycle.
+    """
+    if height % 2 and width % 2:
+        return None
+    transpose = height % 2 == 1
+    w, h = (height, width) if transpose else (width, height)
+
+    order = [(x, 0) for x in range(w)]
+    for y in range(1, h):
+        xs = range(w - 1, 0, -1) if y % 2 else range(1, w)
+        order.extend((x, y) for x in xs)
+    order.extend((0, y) for y in range(h - 1, 0, -1))
+
+    if transpose:
+        order = [(y, x) for x, y in order]
+    successor = [0] * (width * height)
+    for i, (x, y) in enumerate(order):
+        nx, ny = order[(i + 1) % len(order)]
+        successor[y * width + x] = ny * width + nx
+    return tuple(successor)
+
+
+class Autopilot:
+    """Steering policy for one snake; keep one instance per bot"""
+
+    def __init__(self, width, height):
+        """Create a policy for a width x height grid"""
+        self.width = width
+        self.height = height
+        self.neighbours = neighbour_table(width, height)
+        self.cycle = hamiltonian_cycle(width, height)
+        self.field = None          # BFS distances to field_target, -1 = unreachable
+        self.field_target = None
+        self.plan_safe = False
+        self.fallback_ticks = 0
+        self.field_builds = 0
+
+    def steer(self, snake, food):
+        """Point the snake in the direction chosen by decide()"""
+        snake.change_direction(self.decide(snake, food.position))
+
+    def decide(self, snake, food_position):
+        """Return the direction the snake should take on its next update"""
+        width = self.width
+        body = [y * width + x for x, y in snake.positions]
+        head = body[0]
+        # Snake.update checks the new head against the body before the tail
+        # moves out, so the tail cell is a collision too
+        blocked = set(body)
+        reverse = (-snake.direction[0], -snake.direction[1])
+        moves = [(n, step) for n, step in self.neighbours[head]
+                 if n not in blocked and step != reverse]
+        if not moves:
+            return snake.direction
+
+        target = food_position[1] * width + food_position[0]
+        if target != self.field_target:
+            self._plan(body, blocked, target)
+        elif not self.plan_safe and self.fallback_ticks >= REPLAN_INTERVAL:
+            self._plan(body, blocked, target)
+
+        if self.plan_safe:
+            step = self._descend(head, moves)
+            if step is None:
+                # Field went stale (e.g. the snake was steered off it), rebuild once
+                self._plan(body, blocked, target)
+                step = self._descend(head, moves) if self.plan_safe else None
+            if step is not None:
+                return step
+
+        self.fallback_ticks += 1
+        return self._fallback(body, blocked, moves)
+
+    # ── Distance field ─────────────────────────
+    def _bfs(self, start, blocked):
+        """Distances from start over cells not in blocked"""
+        dist = [-1] * (self.width * self.height)
+        dist[start] = 0
+        queue = deque([start])
+        neighbours = self.neighbours
+        while queue:
+            cell = queue.popleft()
+            d = dist[cell] + 1
+            for n, _ in neighbours[cell]:
+                if dist[n] < 0 and n not in blocked:
+                    dist[n] = d
+                    queue.append(n)
+        return dist
+
+    def _plan(self, body, blocked, target):
+        """Rebuild the distance field to target and check the path is safe
+
+        The field is built once per food position. Afterwards the snake only
+        frees cells at its tail and fills cells behind its head, so following
+        strictly decreasing distances stays valid without recomputation.
+        """
+        self.field_builds += 1
+        self.field_target = target
+        self.field = self._bfs(target, blocked - {body[0]})
+        self.fallback_ticks = 0
+        self.plan_safe = self.field[body[0]] > 0 and self._tail_reachable_after(body)
+
+    def _descend(self, head, moves):
+        want = self.field[head] - 1
+        if want < 0:
+            return None
+        for n, step in moves:
+            if self.field[n] == want:
+                return step
+        return None
+
+    def _tail_reachable_after(self, body):
+        """Would the snake still reach its own tail after eating along the field?"""
+        field = self.field
+        path = []
+        cell = body[0]
+        while field[cell] > 0:
+            want = field[cell] - 1
+            cell = next(n for n, _ in self.neighbours[cell] if field[n] == want)
+            path.append(cell)
+        # Body after walking the path and growing by one on the food
+        virtual = (path[::-1] + body)[:len(body) + 1]
+        return self._reachable(virtual[0], virtual[-1], set(virtual))
+
+    def _reachable(self, start, tail, blocked):
+        """Can start reach a cell next to tail without crossing blocked?"""
+        # Blocked cells are pre-marked as seen so the inner loop is one lookup
+        seen = bytearray(self.width * self.height)
+        for cell in blocked:
+            seen[cell] = 1
+        seen[start] = 1
+        stack = [start]
+        neighbours = self.neighbours
+        while stack:
+            cell = stack.pop()
+            for n, _ in neighbours[cell]:
+                if n == tail:
+                    return True
+                if not seen[n]:
+                    seen[n] = 1
+                    stack.append(n)
+        return False
+
+    # ── Fallbacks ──────────────────────────────
+    def _fallback(self, body, blocked, moves):
+        """Follow the Hamiltonian cycle, else chase the tail, else any free cell
+
+        Moves are only taken if the tail can still be reached from them, so
+        a snake that is not lined up with the cycle cannot box itself in.
+        At most MAX_FALLBACK_SEARCHES moves are checked per tick.
+        """
+        tail = body[-1]
+        if self.cycle is not None:
+            cycle = self.cycle
+            nxt = cycle[body[0]]
+            # Once the whole body lies along the cycle, following it is
+            # always safe and no reachability search is needed
+            if nxt in (n for n, _ in moves) and all(
+                    cycle[body[i + 1]] == body[i] for i in range(len(body) - 1)):
+                return next(step for n, step in moves if n == nxt)
+            moves = sorted(moves, key=lambda move: move[0] != nxt)
+
+        for n, step in moves[:MAX_FALLBACK_SEARCHES]:
+            if self._reachable(n, tail, blocked):
+                return step
+        return moves[0][1]
@@ -0,0 +1,221 @@
+"""
+Compact binary encoding of Snake match state for client sync
+State is a plain dict (see match_state()) so it works for Game and SnakeMatch
+
+Snapshot layout (little-endian):
+    HH head x, y    HH food x, y    I score    B speed
+    B  flags: bits 0-1 direction, bit 2 game over
+    then the body as direction run-lengths, one byte per run: bits 6-7 the
+    direction from one segment to the next (head towards tail), bits 0-5
+    run length - 1. A straight snake of any length up to 64 costs one byte.
+
+Delta layout (one tick against the previous state):
+    B  flags: bits 0-1 step direction, bit 2 game over, bit 3 score/speed
+       follow, bit 4 food follows, bit 5 grew (tail kept), bit 6 moved,
+       bit 7 full snapshot follows instead (reset, teleport, ...)
+    [I score, B speed]  [HH food x, y]
+
+Run this module to benchmark sizes and throughput against JSON:
+    python snake_codec.py
+"""
+
+import json
+import struct
+import time
+
+from snake_game import UP, DOWN, LEFT, RIGHT, GRID_WIDTH, GRID_HEIGHT
+from tick_scheduler import SnakeMatch
+from autopilot import Autopilot
+
+DIRECTION_CODES = {UP: 0, DOWN: 1, LEFT: 2, RIGHT: 3}
+DIRECTIONS = (UP, DOWN, LEFT, RIGHT)
+MAX_RUN = 64
+
+_HEADER = struct.Struct('<HHHHIBB')
+_SCORE = struct.Struct('<IB')
+_FOOD = struct.Struct('<HH')
+
+F_GAME_OVER = 0x04
+F_SCORE = 0x08
+F_FOOD = 0x10
+F_GREW = 0x20
+F_MOVED = 0x40
+F_FULL = 0x80
+
+
+def match_state(match):
+    """Extract the synced state from a Game or SnakeMatch"""
+    return {
+        'positions': list(match.snake.positions),
+        'direction': match.snake.direction,
+        'food': match.food.position,
+        'score': match.score,
+        'speed': match.speed,
+        'game_over': match.game_over,
+    }
+
+
+# ── Snapshots ──────────────────────────────────
+def encode(state):
+    """Encode a full state as bytes"""
+    positions = state['positions']
+    hx, hy = positions[0]
+    fx, fy = state['food']
+    flags = DIRECTION_CODES[state['direction']] | (F_GAME_OVER if state['game_over'] else 0)
+    out = bytearray(_HEADER.pack(hx, hy, fx, fy, state['score'], state['speed'], flags))
+
+    run_dir, run_len = None, 0
+    px, py = hx, hy
+    for x, y in positions[1:]:
+        code = DIRECTION_CODES[(x - px, y - py)]
+        if code == run_dir and run_len < MAX_RUN:
+            run_len += 1
+        else:
+            if run_len:
+                out.append(run_dir << 6 | (run_len - 1))
+            run_dir, run_len = code, 1
+        px, py = x, y
+    if run_len:
+        out.append(run_dir << 6 | (run_len - 1))
+    return bytes(out)
+
+
+def decode(data):
+    """Inverse of encode()"""
+    hx, hy, fx, fy, score, speed, flags = _HEADER.unpack_from(data)
+    positions = [(hx, hy)]
+    x, y = hx, hy
+    for byte in data[_HEADER.size:]:
+        dx, dy = DIRECTIONS[byte >> 6]
+        for _ in range((byte & 0x3F) + 1):
+            x += dx
+            y += dy
+            positions.append((x, y))
+    return {
+        'positions': positions,
+        'direction': DIRECTIONS[flags & 3],
+        'food': (fx, fy),
+        'score': score,
+        'speed': speed,
+        'game_over': bool(flags & F_GAME_OVER),
+    }
+
+
+# ── Deltas ─────────────────────────────────────
+def encode_delta(prev, state):
+    """Encode one tick of change since prev, falling back to a full snapshot"""
+    old, new = prev['positions'], state['positions']
+    flags = F_GAME_OVER if state['game_over'] else 0
+    out = bytearray(1)
+
+    if new == old:
+        flags |= DIRECTION_CODES[state['direction']]
+    else:
+        step = (new[0][0] - old[0][0], new[0][1] - old[0][1])
+        grew = len(new) == len(old) + 1
+        # One step forward: the new body is the new head plus the old body,
+        # minus the old tail unless the snake grew
+        if (step in DIRECTION_CODES and step == state['direction']
+                and (grew or len(new) == len(old))
+                and new[1:] == old[:len(new) - 1]):
+            flags |= F_MOVED | DIRECTION_CODES[step] | (F_GREW if grew else 0)
+        else:
+            return bytes((F_FULL,)) + encode(state)
+
+    if state['score'] != prev['score'] or state['speed'] != prev['speed']:
+        flags |= F_SCORE
+        out += _SCORE.pack(state['score'], state['speed'])
+    if state['food'] != prev['food']:
+        flags |= F_FOOD
+        out += _FOOD.pack(*state['food'])
+    out[0] = flags
+    return bytes(out)
+
+
+def apply_delta(prev, data):
+    """Return the state after applying a delta to prev (prev is not modified)"""
+    flags = data[0]
+    if flags & F_FULL:
+        return decode(data[1:])
+
+    direction = DIRECTIONS[flags & 3]
+    positions = prev['positions']
+    if flags & F_MOVED:
+        hx, hy = positions[0]
+        head = (hx + direction[0], hy + direction[1])
+        positions = [head] + (positions if flags & F_GREW else positions[:-1])
+
+    state = dict(prev, positions=positions, direction=direction,
+                 game_over=bool(flags & F_GAME_OVER))
+    off = 1
+    if flags & F_SCORE:
+        state['score'], state['speed'] = _SCORE.unpack_from(data, off)
+        off += _SCORE.size
+    if flags & F_FOOD:
+        state['food'] = _FOOD.unpack_from(data, off)
+    return state
+
+
+# ── Benchmark ──────────────────────────────────
+def to_json(state):
+    """The JSON shape the web client uses today ({x, y} objects per segment)"""
+    return json.dumps({
+        'snake': [{'x': x, 'y': y} for x, y in state['positions']],
+        'food': {'x': state['food'][0], 'y': state['food'][1]},
+        'direction': state['direction'],
+        'score': state['score'],
+        'speed': state['speed'],
+        'game_over': state['game_over'],
+    })
+
+
+def _sample_states(matches=10, max_ticks=3000):
+    """Consecutive states from autopilot-driven matches"""
+    runs = []
+    for i in range(matches):
+        match = SnakeMatch(i, Autopilot(GRID_WIDTH, GRID_HEIGHT))
+        run = [match_state(match)]
+        for _ in range(max_ticks):
+            alive = match.update()
+            run.append(match_state(match))
+            if not alive:
+                break
+        runs.append(run)
+    return runs
+
+
+def _rate(fn, items, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            fn(*item)
+        best = min(best, time.perf_counter() - start)
+    return len(items) / best
+
+
+def benchmark():
+    """Print size and throughput figures for snapshots and deltas"""
+    runs = _sample_states()
+    states = [s for run in runs for s in run]
+    pairs = [(a, b) for run in runs for a, b in zip(run, run[1:])]
+    snaps = [encode(s) for s in states]
+    deltas = [(a, encode_delta(a, b)) for a, b in pairs]
+
+    json_size = sum(len(to_json(s).encode()) for s in states) / len(states)
+    snap_size = sum(map(len, snaps)) / len(snaps)
+    delta_size = sum(len(d) for _, d in deltas) / len(deltas)
+    avg_len = sum(len(s['positions']) for s in states) / len(states)
+    print(f"snake: {len(states)} states from {len(runs)} matches, avg length {avg_len:.0f}")
+    print(f"  json snapshot   {json_size:8.1f} B")
+    print(f"  binary snapshot {snap_size:8.1f} B  ({json_size / snap_size:5.1f}x smaller)")
+    print(f"  binary delta    {delta_size:8.1f} B  ({json_size / delta_size:5.1f}x smaller)")
+    print(f"  json encode     {_rate(to_json, [(s,) for s in states]):12,.0f} /s")
+    print(f"  encode          {_rate(encode, [(s,) for s in states]):12,.0f} /s")
+    print(f"  decode          {_rate(decode, [(d,) for d in snaps]):12,.0f} /s")
+    print(f"  encode_delta    {_rate(encode_delta, pairs):12,.0f} /s")
+    print(f"  apply_delta     {_rate(apply_delta, deltas):12,.0f} /s")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -3,10 +3,16 @@ Classic Snake Game using Pygame
 Features: Snake movement, food spawning, collision detection, scoring, game over screen
 """
 
+import os
 import pygame
 import random
 import sys
 
+# Shared helpers (instrumentation) live one level up in games/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from instrumentation import instrument, frame_timer, tick_timer
+from autopilot import Autopilot
+
 # Initialize Pygame
 pygame.init()
 
@@ -48,6 +54,7 @@ class Snake:
         """Return the position of the snake's head"""
         return self.positions[0]
     
+    @instrument('snake.Snake.update')
     def update(self):
         """Update snake position based on current direction"""
         current_head = self.get_head_position()
@@ -85,6 +92,7 @@ class Snake:
         """Mark snake to grow on next update"""
         self.grow_pending = True
     
+    @instrument('snake.Snake.draw')
     def draw(self, surface):
         """Draw the snake on the surface"""
         for i, position in enumerate(self.positions):
@@ -117,6 +125,7 @@ class Food:
             if self.position not in snake_positions:
                 break
     
+    @instrument('snake.Food.draw')
     def draw(self, surface):
         """Draw the food on the surface"""
         rect = pygame.Rect(self.position[0] * GRID_SIZE, self.position[1] * GRID_SIZE,
@@ -131,14 +140,19 @@ class Food:
 class Game:
     """Main game class to handle game logic and rendering"""
     
-    def __init__(self):
+    def __init__(self, autopilot=False):
         """Initialize game window and game objects"""
+        self.autopilot = autopilot
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Snake Game")
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         
+        # Profiling hooks (no-ops unless OLOS_PROFILE is set)
+        self.frame_timer = frame_timer('snake.frame')
+        self.tick_timer = tick_timer('snake.tick')
+        
         # Game state
         self.reset_game()
         
@@ -175,6 +189,7 @@ class Game:
         self.snake = Snake()
         self.food = Food()
         self.food.randomize_position(self.snake.positions)
+        self.pilot = Autopilot(GRID_WIDTH, GRID_HEIGHT) if self.autopilot else None
         self.score = 0
         self.game_over = False
         self.base_speed = 10
@@ -223,6 +238,10 @@ class Game:
     def update(self):
         """Update game state"""
         if not self.game_over:
+            # Let the bot steer when autopilot is on
+            if self.pilot:
+                self.pilot.steer(self.snake, self.food)
+            
             # Move snake
             if not self.snake.update():
                 self.game_over = True
@@ -244,6 +263,7 @@ class Game:
                 if self.score % 50 == 0:
                     self.speed = min(self.speed + 1, 20)
     
+    @instrument('snake.Game.draw')
     def draw(self):
         """Draw game state to screen"""
         # Clear screen
@@ -303,20 +323,22 @@ class Game:
             running = self.handle_input()
             
             # Update game state
-            self.update()
+            with self.tick_timer:
+                self.update()
             
             # Draw
             self.draw()
             
             # Control frame rate
             self.clock.tick(self.speed)
+            self.frame_timer.tick()
         
         pygame.quit()
         sys.exit()
 
 def main():
-    """Entry point for the game"""
-    game = Game()
+    """Entry point for the game, pass --autopilot to let a bot play"""
+    game = Game(autopilot="--autopilot" in sys.argv[1:])
     game.run()
 
 if __name__ == "__main__":
@@ -0,0 +1,240 @@
+"""
+Tick scheduler for running many Snake matches from a single event loop
+Uses a hashed timer wheel so each match advances at its own speed without
+needing a dedicated thread or a blocking clock.tick() per match
+"""
+
+import time
+from collections import defaultdict
+
+from snake_game import Snake, Food, GRID_WIDTH, GRID_HEIGHT
+from autopilot import Autopilot
+
+# Wheel defaults: 1 ms slots, 512 slots => one revolution every 512 ms,
+# enough to hold the slowest match (10 ticks/s = 100 ms) without wrapping
+DEFAULT_RESOLUTION_MS = 1
+DEFAULT_WHEEL_SLOTS = 512
+
+
+class SnakeMatch:
+    """Headless Snake match, mirrors Game.update() without any rendering"""
+
+    def __init__(self, match_id, policy=None):
+        """Create a fresh match with the same starting state as Game
+
+        policy, if given, is steered before every tick (e.g. an Autopilot bot)
+        """
+        self.match_id = match_id
+        self.policy = policy
+        self.snake = Snake()
+        self.food = Food()
+        self.food.randomize_position(self.snake.positions)
+        self.score = 0
+        self.game_over = False
+        self.base_speed = 10
+        self.speed = self.base_speed
+
+    def update(self):
+        """Advance the match by one tick, returns False once the match ends"""
+        if self.game_over:
+            return False
+
+        if self.policy:
+            self.policy.steer(self.snake, self.food)
+
+        if not self.snake.update():
+            self.game_over = True
+            return False
+
+        if self.snake.get_head_position() == self.food.position:
+            self.snake.grow()
+            self.score += 10
+            self.food.randomize_position(self.snake.positions)
+
+            # Same difficulty curve as Game.update
+            if self.score % 50 == 0:
+                self.speed = min(self.speed + 1, 20)
+
+        return True
+
+
+class _Timer:
+    """Wheel entry for one match"""
+
+    __slots__ = ('match', 'deadline', 'rounds', 'cancelled')
+
+    def __init__(self, match, deadline, rounds):
+        self.match = match
+        self.deadline = deadline      # absolute due time in wheel ticks
+        self.rounds = rounds          # full revolutions left before firing
+        self.cancelled = False
+
+
+class TickScheduler:
+    """Hashed timer wheel driving many matches at their individual speeds
+
+    Matches are hashed into slots by their next deadline. Each slot is
+    processed once per revolution, so every match that falls due in the
+    same slot is ticked in one batch (coalesced). Each match is rescheduled
+    from its own deadline using its *current* speed, so speed-ups from
+    scoring apply on the very next tick. After a stall a late match fires
+    once and resumes from now instead of replaying every missed tick; the
+    skipped time shows up as lag.
+    """
+
+    def __init__(self, resolution_ms=DEFAULT_RESOLUTION_MS,
+                 wheel_slots=DEFAULT_WHEEL_SLOTS, clock=time.monotonic):
+        """Create an empty wheel; clock must return seconds"""
+        self.resolution = resolution_ms / 1000.0
+        self.wheel_slots = wheel_slots
+        self.slots = [[] for _ in range(wheel_slots)]
+        self.clock = clock
+        self.timers = {}
+        self.start_time = clock()
+        self.current_tick = 0
+        self.on_tick = None           # optional callback(match, alive)
+
+        # Lag statistics, in seconds
+        self.ticks_fired = 0
+        self.batches = 0
+        self.total_lag = 0.0
+        self.max_lag = 0.0
+        self.lag_histogram = defaultdict(int)   # lag bucket (ms) -> count
+
+    def _now_tick(self):
+        """Current wall time expressed in wheel ticks"""
+        return int((self.clock() - self.start_time) / self.resolution)
+
+    def _interval(self, match):
+        """Wheel ticks between two updates of a match at its current speed"""
+        return max(1, round(1.0 / (match.speed * self.resolution)))
+
+    def _insert(self, timer):
+        delay = timer.deadline - self.current_tick
+        # A deadline at or before the cursor goes into the next slot
+        delay = max(delay, 1)
+        timer.rounds = (delay - 1) // self.wheel_slots
+        self.slots[(self.current_tick + delay) % self.wheel_slots].append(timer)
+
+    def add(self, match):
+        """Schedule a match; its first tick is one interval from now"""
+        if match.match_id in self.timers:
+            raise ValueError(f"Match {match.match_id!r} is already scheduled")
+        timer = _Timer(match, self.current_tick + self._interval(match), 0)
+        self.timers[match.match_id] = timer
+        self._insert(timer)
+        return match
+
+    def remove(self, match_id):
+        """Unschedule a match, the wheel entry is dropped lazily"""
+        timer = self.timers.pop(match_id, None)
+        if timer:
+            timer.cancelled = True
+
+    def __len__(self):
+        return len(self.timers)
+
+    def advance(self, now_tick=None):
+        """Process every slot up to now_tick, returns number of match ticks fired
+
+        Call this from an existing event loop (e.g. asyncio) instead of run()
+        when the scheduler should share a loop with networking code.
+        """
+        if now_tick is None:
+            now_tick = self._now_tick()
+        fired = 0
+
+        while self.current_tick < now_tick:
+            self.current_tick += 1
+            idx = self.current_tick % self.wheel_slots
+            slot = self.slots[idx]
+            if not slot:
+                continue
+
+            due = []
+            pending = []
+            for timer in slot:
+                if timer.cancelled:
+                    continue
+                if timer.rounds > 0:
+                    timer.rounds -= 1
+                    pending.append(timer)
+                else:
+                    due.append(timer)
+            self.slots[idx] = pending
+            if not due:
+                continue
+
+            # All matches due in this slot are ticked as one batch
+            self.batches += 1
+            for timer in due:
+                self._record_lag((now_tick - timer.deadline) * self.resolution)
+                alive = timer.match.update()
+                fired += 1
+                if self.on_tick:
+                    self.on_tick(timer.match, alive)
+                if alive:
+                    # Don't schedule into the past, or a stall would replay
+                    # every missed tick in one burst
+                    timer.deadline = max(timer.deadline + self._interval(timer.match),
+                                         now_tick + 1)
+                    self._insert(timer)
+                else:
+                    self.timers.pop(timer.match.match_id, None)
+
+        return fired
+
+    def _record_lag(self, lag):
+        self.ticks_fired += 1
+        self.total_lag += lag
+        if lag > self.max_lag:
+            self.max_lag = lag
+        self.lag_histogram[int(lag * 1000)] += 1
+
+    def next_deadline(self):
+        """Seconds until the next non-empty slot, or None if nothing is scheduled"""
+        if not self.timers:
+            return None
+        for offset in range(1, self.wheel_slots + 1):
+            if self.slots[(self.current_tick + offset) % self.wheel_slots]:
+                return max(0.0, (self.current_tick + offset) * self.resolution
+                           - (self.clock() - self.start_time))
+        return self.wheel_slots * self.resolution
+
+    def run(self, until=None, sleep=time.sleep):
+        """Blocking event loop, runs until all matches finish or `until` seconds pass"""
+        stop_at = None if until is None else self.clock() + until
+        while self.timers:
+            if stop_at is not None and self.clock() >= stop_at:
+                break
+            self.advance()
+            wait = self.next_deadline()
+            if wait:
+                sleep(wait)
+
+    def lag_report(self):
+        """Summary of scheduling lag: how late ticks fired relative to their deadline"""
+        avg = self.total_lag / self.ticks_fired if self.ticks_fired else 0.0
+        return {
+            'matches': len(self.timers),
+            'ticks_fired': self.ticks_fired,
+            'batches': self.batches,
+            'avg_batch_size': self.ticks_fired / self.batches if self.batches else 0.0,
+            'avg_lag_ms': avg * 1000,
+            'max_lag_ms': self.max_lag * 1000,
+            'lag_histogram_ms': dict(sorted(self.lag_histogram.items())),
+        }
+
+
+def main():
+    """Simulate a batch of autopilot-driven matches and print the lag report"""
+    scheduler = TickScheduler()
+    for i in range(1000):
+        scheduler.add(SnakeMatch(i, Autopilot(GRID_WIDTH, GRID_HEIGHT)))
+    scheduler.run(until=5)
+    for key, value in scheduler.lag_report().items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()